@@ -13,6 +13,7 @@ from typing import Dict, List, Any
 from pathlib import Path
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import itertools
+from sklearn.inspection import permutation_importance
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -223,10 +224,20 @@ def run_strategy_benchmark(
 
         # Add strategy-specific metrics
         if isinstance(strategy, MLStrategyCombiner):
+            # Histogram boosting has no impurity importances, so rank features
+            # by how much shuffling each one hurts the model
+            features = strategy.prepare_features(data)
+            importance = permutation_importance(
+                strategy.model,
+                features.to_numpy(),
+                strategy.prepare_labels(data),
+                n_repeats=5,
+                random_state=42,
+            )
             feature_importance = pd.DataFrame(
                 {
-                    "feature": strategy.prepare_features(data[:1]).columns,
-                    "importance": strategy.model.feature_importances_,
+                    "feature": features.columns,
+                    "importance": importance.importances_mean,
                 }
             ).sort_values("importance", ascending=False)
 
@@ -64,6 +64,7 @@ def main():
             position_size=config.get("position_size", 1.0),
             stop_loss=config.get("stop_loss", 0.02),
             take_profit=config.get("take_profit", 0.04),
+            save_results=True,
         )
 
         # Split data into training and testing sets
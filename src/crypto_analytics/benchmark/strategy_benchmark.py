@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Type
 from datetime import datetime, timedelta
 from ..strategies.base_strategy import BaseStrategy
@@ -191,6 +192,50 @@ class StrategyBenchmark:
         self.results[asset_name] = results
         return results
 
+    def run_benchmarks(
+        self,
+        datasets: Dict[str, pd.DataFrame],
+        initial_capital: float = 10000,
+        transaction_costs: float = 0.001,
+        max_workers: Optional[int] = 1,
+    ) -> Dict[str, Dict]:
+        """Run benchmark tests for several assets in parallel.
+
+        Assets are independent, so with max_workers above 1 each one is
+        benchmarked in its own worker process and the results are collected
+        back into this instance.
+
+        Args:
+            datasets: Mapping of asset name to OHLCV data
+            initial_capital: Initial capital for portfolio calculation
+            transaction_costs: Transaction costs per trade (as fraction)
+            max_workers: Maximum number of worker processes; 1 (the default)
+                runs serially in the current process and None uses one worker
+                per CPU
+
+        Returns:
+            Dictionary of benchmark results keyed by asset name
+        """
+        if max_workers == 1:
+            for asset_name, data in datasets.items():
+                self.run_benchmark(data, asset_name, initial_capital, transaction_costs)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    asset_name: executor.submit(
+                        self.run_benchmark,
+                        data,
+                        asset_name,
+                        initial_capital,
+                        transaction_costs,
+                    )
+                    for asset_name, data in datasets.items()
+                }
+                for asset_name, future in futures.items():
+                    self.results[asset_name] = future.result()
+
+        return {asset_name: self.results[asset_name] for asset_name in datasets}
+
     def generate_report(self) -> pd.DataFrame:
         """Generate a comprehensive benchmark report.
 
@@ -2,6 +2,6 @@
 
 from .base_indicator import BaseIndicator
 from .macd import MACD
-from .bollinger import BollingerBands
+from .bollinger import BollingerBands, BollingerOnline
 
-__all__ = ["BaseIndicator", "MACD", "BollingerBands"]
+__all__ = ["BaseIndicator", "MACD", "BollingerBands", "BollingerOnline"]
@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, Tuple
 from .base_indicator import BaseIndicator
+from ..utils.rolling import rolling_mean_std
 
 
 class BollingerBands(BaseIndicator):
@@ -29,18 +31,20 @@ class BollingerBands(BaseIndicator):
         """
         self.validate_data(data, ["close"])
 
-        # Calculate middle band (SMA)
-        middle_band = data["close"].rolling(window=self.params["window"]).mean()
-
-        # Calculate standard deviation
-        std = data["close"].rolling(window=self.params["window"]).std()
+        # Calculate middle band (SMA) and standard deviation from one window
+        middle_values, std_values = rolling_mean_std(
+            data["close"].to_numpy(dtype=np.float64), self.params["window"]
+        )
+        middle_band = pd.Series(middle_values, index=data.index)
+        std = pd.Series(std_values, index=data.index)
 
-        # Calculate bands
-        upper_band = middle_band + (std * self.params["num_std"])
-        lower_band = middle_band - (std * self.params["num_std"])
+        # Calculate bands from a single band offset
+        band_offset = std * self.params["num_std"]
+        upper_band = middle_band + band_offset
+        lower_band = middle_band - band_offset
 
-        # Calculate bandwidth
-        bandwidth = (upper_band - lower_band) / middle_band
+        # Calculate bandwidth (upper - lower is twice the offset)
+        bandwidth = (2 * band_offset) / middle_band
 
         return pd.DataFrame(
             {
@@ -62,3 +66,43 @@ class BollingerBands(BaseIndicator):
             "bandwidth_threshold": 0.1,
             "price_distance_threshold": 0.02,  # 2% from bands
         }
+
+
+class BollingerOnline:
+    """Bollinger Bands updated one price at a time for streaming data."""
+
+    def __init__(self, window: int = 20, num_std: float = 2):
+        """Initialize streaming Bollinger Bands.
+
+        Args:
+            window: Period for moving average
+            num_std: Number of standard deviations
+        """
+        if window < 1:
+            raise ValueError("Window must be a positive integer")
+        self.window = window
+        self.num_std = num_std
+        self.prices = deque(maxlen=window)
+
+    def push(self, price: float) -> Tuple[float, float, float]:
+        """Add a price and return the bands for the latest window.
+
+        Only the trailing window is kept, so each update costs O(window)
+        regardless of how much history has been seen. Moments are taken with
+        the same two-pass form as the batch indicator.
+
+        Args:
+            price: Latest close price
+
+        Returns:
+            tuple: (middle_band, upper_band, lower_band), NaN until the window
+            is full or while it contains NaN
+        """
+        self.prices.append(price)
+        if len(self.prices) < self.window or self.window < 2:
+            return np.nan, np.nan, np.nan
+
+        values = np.fromiter(self.prices, dtype=np.float64, count=self.window)
+        middle = values.mean()
+        band_offset = values.std(ddof=1) * self.num_std
+        return middle, middle + band_offset, middle - band_offset
@@ -53,6 +53,40 @@ class MACD(BaseIndicator):
             index=data.index,
         )
 
+    def calculate_batch(self, closes: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Calculate MACD indicator values for several symbols at once.
+
+        The EMAs run over the whole close frame in one call per period, which
+        amortizes pandas' per-call overhead across symbols.
+
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+
+        Returns:
+            Dictionary mapping each symbol to a DataFrame with columns:
+            macd_line, signal_line, histogram
+        """
+        fast_ema = closes.ewm(span=self.params["fast_period"], adjust=False).mean()
+        slow_ema = closes.ewm(span=self.params["slow_period"], adjust=False).mean()
+
+        macd_line = fast_ema - slow_ema
+        signal_line = macd_line.ewm(
+            span=self.params["signal_period"], adjust=False
+        ).mean()
+        histogram = macd_line - signal_line
+
+        return {
+            symbol: pd.DataFrame(
+                {
+                    "macd_line": macd_line[symbol],
+                    "signal_line": signal_line[symbol],
+                    "histogram": histogram[symbol],
+                },
+                index=closes.index,
+            )
+            for symbol in closes.columns
+        }
+
     def get_signal_thresholds(self) -> Dict[str, float]:
         """Get MACD signal thresholds.
 
@@ -104,20 +104,27 @@ class AdaptiveBollingerStrategy(AdaptiveStrategy):
         # Get adaptive parameters
         params = self.get_adaptive_parameters(self.current_context)
 
-        # Calculate Bollinger Bands
-        rolling_mean = data["Close"].rolling(window=params["window"]).mean()
-        rolling_std = data["Close"].rolling(window=params["window"]).std()
+        # Calculate Bollinger Bands for the latest bar only; both moments come
+        # from a single pass over the trailing window
+        window = params["window"]
+        close = data["Close"].to_numpy(dtype=np.float64)
+        recent = close[-window:]
+        if len(recent) < window or np.isnan(recent).any():
+            rolling_mean = rolling_std = np.nan
+        else:
+            rolling_mean = recent.mean()
+            rolling_std = recent.std(ddof=1)
 
         upper_band = rolling_mean + (rolling_std * params["num_std"])
         lower_band = rolling_mean - (rolling_std * params["num_std"])
 
         # Calculate price position within bands
-        current_price = data["Close"].iloc[-1]
-        band_width = upper_band.iloc[-1] - lower_band.iloc[-1]
-        relative_position = (current_price - rolling_mean.iloc[-1]) / (band_width / 2)
+        current_price = close[-1]
+        band_width = upper_band - lower_band
+        relative_position = (current_price - rolling_mean) / (band_width / 2)
 
         # Calculate trend strength and direction
-        price_trend = data["Close"].diff(params["window"]).iloc[-1]
+        price_trend = close[-1] - close[-1 - window] if len(close) > window else np.nan
         trend_direction = np.sign(price_trend) if abs(price_trend) > 0 else 0
 
         # Initialize signal
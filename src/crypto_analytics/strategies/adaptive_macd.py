@@ -9,6 +9,7 @@ from .adaptive_strategy import (
     MarketRegime,
     MarketContext,
 )
+from ..utils.rolling import ewm_mean
 
 
 class AdaptiveMACDStrategy(AdaptiveStrategy):
@@ -98,18 +99,20 @@ class AdaptiveMACDStrategy(AdaptiveStrategy):
         # Get adaptive periods
         periods = self.get_adaptive_periods(self.current_context)
 
-        # Calculate MACD
-        fast_ema = data["Close"].ewm(span=periods["fast"], adjust=False).mean()
-        slow_ema = data["Close"].ewm(span=periods["slow"], adjust=False).mean()
+        # Calculate MACD on raw arrays; this runs once per bar on a short
+        # trailing window, where pandas' per-call overhead dominates
+        close = data["Close"].to_numpy(dtype=np.float64)
+        fast_ema = ewm_mean(close, periods["fast"])
+        slow_ema = ewm_mean(close, periods["slow"])
 
         macd_line = fast_ema - slow_ema
-        signal_line = macd_line.ewm(span=periods["signal"], adjust=False).mean()
+        signal_line = ewm_mean(macd_line, periods["signal"])
         histogram = macd_line - signal_line
 
-        # Calculate signal strength
-        hist_std = histogram.rolling(20).std()
-        if hist_std.iloc[-1] > 0:
-            signal_strength = histogram.iloc[-1] / (hist_std.iloc[-1] * 2)
+        # Calculate signal strength from the last 20 histogram values
+        hist_std = histogram[-20:].std(ddof=1) if len(histogram) >= 20 else np.nan
+        if hist_std > 0:
+            signal_strength = histogram[-1] / (hist_std * 2)
         else:
             signal_strength = 0
 
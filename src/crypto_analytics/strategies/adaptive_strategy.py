@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from ..utils.rolling import true_range
 
 
 class MarketRegime(Enum):
@@ -71,10 +72,14 @@ class AdaptiveStrategy(ABC):
             MarketContext object with regime classification
         """
         # Calculate trend strength using ADX
-        high_low = data["High"] - data["Low"]
-        high_close = np.abs(data["High"] - data["Close"].shift())
-        low_close = np.abs(data["Low"] - data["Close"].shift())
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+        tr = pd.Series(
+            true_range(
+                data["High"].to_numpy(),
+                data["Low"].to_numpy(),
+                data["Close"].to_numpy(),
+            ),
+            index=data.index,
+        )
         atr = tr.rolling(14).mean()
 
         # Calculate directional movement
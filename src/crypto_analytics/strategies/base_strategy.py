@@ -29,19 +29,18 @@ class BaseStrategy(ABC):
         if len(data) == 0:
             raise ValueError("Input data is empty")
 
-        # Initialize signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals["price"] = data["close"]
-        signals["signal"] = 0  # Initialize with no position
-
-        # Calculate indicator values
+        # Collect price, an empty signal and indicator values, then build the
+        # signals DataFrame in one allocation
+        columns = {
+            "price": data["close"],
+            "signal": np.zeros(len(data), dtype=np.int8),  # No position
+        }
         for indicator in self.indicators:
             indicator_data = indicator.calculate(data)
-            # Add indicator columns to signals DataFrame
             for col in indicator_data.columns:
-                signals[col] = indicator_data[col]
+                columns[col] = indicator_data[col]
 
-        return signals
+        return pd.DataFrame(columns, index=data.index)
 
     @abstractmethod
     def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
@@ -64,8 +63,17 @@ class BaseStrategy(ABC):
         Returns:
             Dictionary with signal generation results
         """
-        # Calculate signals
-        signals = self.calculate_signals(data)
+        return self._evaluate_signals(self.calculate_signals(data))
+
+    def _evaluate_signals(self, signals: pd.DataFrame) -> Dict[str, Any]:
+        """Apply signal rules to indicator values and calculate performance.
+
+        Args:
+            signals: DataFrame with price and indicator values
+
+        Returns:
+            Dictionary with signal generation results
+        """
         signals = self.generate_signal_rules(signals)
 
         # Calculate returns and performance metrics
@@ -73,7 +81,7 @@ class BaseStrategy(ABC):
         signals["returns"] = signals["price"].pct_change()
         signals["strategy_returns"] = signals["position"].shift(1) * signals["returns"]
 
-        # Get latest signal information
+        # Get latest signal information, reading the last row only once
         latest = signals.iloc[-1].to_dict()
         latest["timestamp"] = signals.index[-1]
 
@@ -91,7 +99,7 @@ class BaseStrategy(ABC):
             "timestamp": datetime.now(),
             "parameters": parameters,
             "performance": performance,
-            "current_position": signals["position"].iloc[-1],
+            "current_position": latest["position"],
             "latest_signal": latest,
         }
 
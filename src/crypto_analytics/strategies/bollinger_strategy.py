@@ -4,7 +4,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional
 from .base_strategy import BaseStrategy
-from ..indicators import BollingerBands
+from ..indicators import BollingerBands, BollingerOnline
 
 
 class BollingerStrategy(BaseStrategy):
@@ -18,6 +18,7 @@ class BollingerStrategy(BaseStrategy):
         """
         super().__init__([BollingerBands(params)])
         self.max_position = 1.0  # Maximum allowed position size
+        self._online = None  # Band state for streaming updates
 
     def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on Bollinger Bands.
@@ -38,45 +39,97 @@ class BollingerStrategy(BaseStrategy):
             signals["price"] - signals["middle_band"]
         ) / signals["middle_band"]
 
-        # Initialize signals
-        signals["signal"] = 0
-        signals["position"] = 0
+        # Walk the bars over Python floats; each signal depends on the
+        # position left by the previous bar
+        percent_b = signals["percent_b"].to_numpy(dtype=np.float64).tolist()
+        price_deviation = (
+            signals["price_deviation"].to_numpy(dtype=np.float64).tolist()
+        )
+        signal = [0.0] * len(signals)
+        position = [0.0] * len(signals)
+        prev_position = 0.0
 
         for i in range(1, len(signals)):
-            prev_position = signals.iloc[i - 1]["position"]
-
-            # Check oversold conditions
-            oversold = (signals.iloc[i]["percent_b"] < 0) or (
-                (signals.iloc[i]["percent_b"] < 0.2)
-                and (signals.iloc[i]["price_deviation"] < -0.02)
+            signal[i] = self._rule_signal(
+                percent_b[i], price_deviation[i], prev_position
             )
 
-            # Check overbought conditions
-            overbought = (signals.iloc[i]["percent_b"] > 1) or (
-                (signals.iloc[i]["percent_b"] > 0.8)
-                and (signals.iloc[i]["price_deviation"] > 0.02)
+            # Update position with limits
+            prev_position = min(
+                max(prev_position + signal[i], -self.max_position),
+                self.max_position,
             )
+            position[i] = prev_position
 
-            # Check middle band reversion
-            middle_band_threshold = 0.05
-            middle_band_reversion = (
-                (signals.iloc[i]["percent_b"] > 0.5 - middle_band_threshold)
-                and (signals.iloc[i]["percent_b"] < 0.5 + middle_band_threshold)
-                and (abs(prev_position) > 0)
-            )
+        signals["signal"] = np.array(signal, dtype=np.float64)
+        signals["position"] = np.array(position, dtype=np.float64)
 
-            # Generate signals with position limits
-            if oversold and prev_position < self.max_position:
-                signals.iloc[i, signals.columns.get_loc("signal")] = 1
-            elif overbought and prev_position > -self.max_position:
-                signals.iloc[i, signals.columns.get_loc("signal")] = -1
-            elif middle_band_reversion:
-                signals.iloc[i, signals.columns.get_loc("signal")] = -prev_position
+        return signals
 
-            # Update position with limits
-            new_position = prev_position + signals.iloc[i]["signal"]
-            signals.iloc[i, signals.columns.get_loc("position")] = np.clip(
-                new_position, -self.max_position, self.max_position
-            )
+    def _rule_signal(
+        self, percent_b: float, price_deviation: float, prev_position: float
+    ) -> float:
+        """Apply the band rules to a single bar.
 
-        return signals
+        Args:
+            percent_b: Position of price within the bands
+            price_deviation: Distance from the middle band as a fraction
+            prev_position: Position held before this bar
+
+        Returns:
+            float: Signal for the bar (1 buy, -1 sell, -prev_position to close)
+        """
+        # Check oversold conditions
+        oversold = (percent_b < 0) or ((percent_b < 0.2) and (price_deviation < -0.02))
+
+        # Check overbought conditions
+        overbought = (percent_b > 1) or (
+            (percent_b > 0.8) and (price_deviation > 0.02)
+        )
+
+        # Check middle band reversion
+        middle_band_threshold = 0.05
+        middle_band_reversion = (
+            (percent_b > 0.5 - middle_band_threshold)
+            and (percent_b < 0.5 + middle_band_threshold)
+            and (abs(prev_position) > 0)
+        )
+
+        # Generate signals with position limits
+        if oversold and prev_position < self.max_position:
+            return 1
+        elif overbought and prev_position > -self.max_position:
+            return -1
+        elif middle_band_reversion:
+            return -prev_position
+        return 0
+
+    def update(self, price: float) -> float:
+        """Process one new price and return its trading signal.
+
+        Streaming counterpart of generate_signal_rules for live use: band
+        state and the current position carry over between calls, so a new
+        bar does not recompute the full history.
+
+        Args:
+            price: Latest close price
+
+        Returns:
+            float: Signal for the new bar
+        """
+        if self._online is None:
+            params = self.indicators[0].params
+            self._online = BollingerOnline(params["window"], params["num_std"])
+
+        middle_band, upper_band, lower_band = self._online.push(price)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent_b = (price - lower_band) / (upper_band - lower_band)
+            price_deviation = (price - middle_band) / middle_band
+
+        signal = self._rule_signal(percent_b, price_deviation, self.current_position)
+        self.current_position = float(
+            np.clip(
+                self.current_position + signal, -self.max_position, self.max_position
+            )
+        )
+        return signal
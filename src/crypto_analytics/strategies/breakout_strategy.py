@@ -4,10 +4,19 @@ import pandas as pd
 import numpy as np
 import yaml
 import logging
+import math
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from .base_strategy import BaseStrategy
 from ..indicators import BaseIndicator
+from ..utils.rolling import (
+    rolling_max,
+    rolling_mean_std,
+    rolling_min,
+    rolling_sum,
+    true_range,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -66,108 +75,105 @@ class BreakoutStrategy(BaseStrategy):
         signals["low"] = data["low"]
         signals["volume"] = data["volume"]
 
-        # Calculate ATR
-        tr = pd.DataFrame(
-            {
-                "hl": data["high"] - data["low"],
-                "hc": abs(data["high"] - data["close"].shift(1)),
-                "lc": abs(data["low"] - data["close"].shift(1)),
-            }
-        ).max(axis=1)
-        signals["atr"] = tr.rolling(window=self.resistance_periods).mean()
-
-        # Calculate volume metrics
-        signals["avg_volume"] = (
-            data["volume"].rolling(window=self.lookback_period).mean()
-        )
+        # Calculate ATR and volume metrics once, shared with level detection
+        indicators = self._compute_shared_indicators(data)
+        signals["atr"] = indicators["atr"]
+        signals["avg_volume"] = indicators["avg_volume"]
 
-        # Identify resistance levels
-        signals["resistance_level"] = None
-        resistance_mask = self.identify_resistance(data)
-        signals.loc[resistance_mask, "resistance_level"] = data.loc[
-            resistance_mask, "high"
-        ]
+        # Identify resistance (1) and support (-1) levels, NaN where none
+        signals["resistance_level"] = np.nan
+        resistance_mask = self.identify_resistance(data, indicators)
+        is_level = resistance_mask != 0
+        signals.loc[is_level, "resistance_level"] = resistance_mask[is_level]
 
         # Initialize stop loss and take profit columns
-        signals["stop_loss"] = None
-        signals["take_profit"] = None
+        signals["stop_loss"] = np.nan
+        signals["take_profit"] = np.nan
 
         return signals
 
-    def identify_resistance(self, data: pd.DataFrame) -> pd.Series:
-        """Identify resistance and support levels using local highs and lows."""
-        # Calculate rolling max/min of highs/lows
-        highs = data["high"].rolling(window=self.resistance_periods, center=False).max()
-        lows = data["low"].rolling(window=self.resistance_periods, center=False).min()
-
-        # Calculate average true range for dynamic thresholds
-        tr = pd.DataFrame(
-            {
-                "hl": data["high"] - data["low"],
-                "hc": abs(data["high"] - data["close"].shift(1)),
-                "lc": abs(data["low"] - data["close"].shift(1)),
-            }
-        ).max(axis=1)
-        atr = tr.rolling(window=self.resistance_periods).mean()
-
-        # Calculate volume profile
-        volume_ma = data["volume"].rolling(window=self.lookback_period).mean()
-        volume_std = data["volume"].rolling(window=self.lookback_period).std()
-        high_volume = data["volume"] > (
-            volume_ma + volume_std * self.volume_std_multiplier
-        )
+    def _compute_shared_indicators(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Calculate indicators used by both signal and level calculation.
+
+        Args:
+            data: DataFrame with OHLCV data
 
-        # Calculate price momentum
+        Returns:
+            dict: atr, avg_volume, volume_std and momentum arrays
+        """
+        avg_volume, volume_std = rolling_mean_std(
+            data["volume"].to_numpy(dtype=np.float64), self.lookback_period
+        )
         returns = data["close"].pct_change()
-        momentum = returns.rolling(window=3).sum()
+
+        return {
+            "atr": self._compute_atr(data),
+            "avg_volume": avg_volume,
+            "volume_std": volume_std,
+            "momentum": rolling_sum(returns.to_numpy(dtype=np.float64), 3),
+        }
+
+    def _compute_atr(self, data: pd.DataFrame) -> np.ndarray:
+        """Calculate average true range over the resistance window."""
+        tr = true_range(
+            data["high"].to_numpy(dtype=np.float64),
+            data["low"].to_numpy(dtype=np.float64),
+            data["close"].to_numpy(dtype=np.float64),
+        )
+        return rolling_sum(tr, self.resistance_periods) / self.resistance_periods
+
+    def identify_resistance(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[Dict[str, np.ndarray]] = None,
+    ) -> pd.Series:
+        """Identify resistance and support levels using local highs and lows.
+
+        Args:
+            data: DataFrame with OHLCV data
+            indicators: Precomputed output of _compute_shared_indicators;
+                calculated from data when omitted
+
+        Returns:
+            pd.Series: 1 at resistance, -1 at support, 0 elsewhere
+        """
+        if indicators is None:
+            indicators = self._compute_shared_indicators(data)
+
+        high = data["high"].to_numpy(dtype=np.float64)
+        low = data["low"].to_numpy(dtype=np.float64)
+        volume = data["volume"].to_numpy(dtype=np.float64)
+        momentum = indicators["momentum"]
+
+        # Conditions shared by both sides: bar range is significant compared
+        # to ATR, and volume is above its recent band
+        is_significant = (high - low) > indicators["atr"] * self.min_breakout_size
+        high_volume = volume > (
+            indicators["avg_volume"]
+            + indicators["volume_std"] * self.volume_std_multiplier
+        )
 
         # A point is resistance if:
         # 1. It's a local high (higher than previous and next periods)
         # 2. Price hasn't exceeded it in the recent lookback period
         # 3. The high is significant compared to ATR
         # 4. Volume is above average or momentum is positive
-        is_local_high = (data["high"] > data["high"].shift(1)) & (
-            data["high"] > data["high"].shift(-1)
-        )
-        not_exceeded_high = (
-            data["high"].rolling(window=self.lookback_period, center=False).max()
-            <= data["high"]
-        )
-        is_significant_high = (data["high"] - data["low"]) > (
-            atr * self.min_breakout_size
-        )
-        has_momentum_up = momentum > 0
-
-        is_resistance = (
-            is_local_high
-            & not_exceeded_high
-            & is_significant_high
-            & (high_volume | has_momentum_up)
-        )
+        is_resistance = np.zeros(len(high), dtype=bool)
+        is_resistance[1:-1] = (high[1:-1] > high[:-2]) & (high[1:-1] > high[2:])
+        is_resistance &= rolling_max(high, self.lookback_period) <= high
+        is_resistance &= is_significant
+        is_resistance &= high_volume | (momentum > 0)
 
         # A point is support if:
         # 1. It's a local low (lower than previous and next periods)
         # 2. Price hasn't gone below it in the recent lookback period
         # 3. The low is significant compared to ATR
         # 4. Volume is above average or momentum is negative
-        is_local_low = (data["low"] < data["low"].shift(1)) & (
-            data["low"] < data["low"].shift(-1)
-        )
-        not_exceeded_low = (
-            data["low"].rolling(window=self.lookback_period, center=False).min()
-            >= data["low"]
-        )
-        is_significant_low = (data["high"] - data["low"]) > (
-            atr * self.min_breakout_size
-        )
-        has_momentum_down = momentum < 0
-
-        is_support = (
-            is_local_low
-            & not_exceeded_low
-            & is_significant_low
-            & (high_volume | has_momentum_down)
-        )
+        is_support = np.zeros(len(low), dtype=bool)
+        is_support[1:-1] = (low[1:-1] < low[:-2]) & (low[1:-1] < low[2:])
+        is_support &= rolling_min(low, self.lookback_period) >= low
+        is_support &= is_significant
+        is_support &= high_volume | (momentum < 0)
 
         # Log levels found
         resistance_count = is_resistance.sum()
@@ -176,12 +182,12 @@ class BreakoutStrategy(BaseStrategy):
             f"Found {resistance_count} resistance and {support_count} support points"
         )
 
-        # Create a series that marks both resistance (1) and support (-1) levels
-        levels = pd.Series(0, index=data.index)
+        # Mark both resistance (1) and support (-1) levels
+        levels = np.zeros(len(high), dtype=np.int64)
         levels[is_resistance] = 1
         levels[is_support] = -1
 
-        return levels
+        return pd.Series(levels, index=data.index)
 
     def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on breakout conditions."""
@@ -190,84 +196,126 @@ class BreakoutStrategy(BaseStrategy):
         last_trade_price = None
         consecutive_losses = 0
         last_trade_time = None
+        stop_loss = take_profit = np.nan
+
+        # Read inputs once as lists of Python floats for the scalar loop
+        n = len(signals)
+        price = signals["price"].to_numpy(dtype=np.float64).tolist()
+        high = signals["high"].to_numpy(dtype=np.float64).tolist()
+        low = signals["low"].to_numpy(dtype=np.float64).tolist()
+        volume = signals["volume"].to_numpy(dtype=np.float64).tolist()
+        avg_volume_values = signals["avg_volume"].to_numpy(dtype=np.float64).tolist()
+        atr_values = signals["atr"].to_numpy(dtype=np.float64).tolist()
+        levels = signals["resistance_level"].to_numpy(dtype=np.float64).tolist()
+
+        # Buffer outputs and assign each column once after the loop
+        signal = np.zeros(n, dtype=np.int8)
+        stop_losses = np.full(n, np.nan)
+        take_profits = np.full(n, np.nan)
+
+        # Walk zipped rows after the warm-up, each carrying the previous
+        # bar's close, high and low
+        start = self.lookback_period
+        rows = zip(
+            range(start, n),
+            islice(price, start, None),
+            islice(high, start, None),
+            islice(low, start, None),
+            islice(volume, start, None),
+            islice(avg_volume_values, start, None),
+            islice(atr_values, start, None),
+            islice(levels, start, None),
+            islice(price, start - 1, None),
+            islice(high, start - 1, None),
+            islice(low, start - 1, None),
+        )
 
-        # Initialize signal column if not present
-        signals["signal"] = 0
-
-        for i in range(self.lookback_period, len(signals)):
-            # Update position based on previous signal
-            if i > 0:
-                current_position = (
-                    signals["position"].iloc[i - 1]
-                    if "position" in signals.columns
-                    else current_position
-                )
-
-            # Get current prices and levels
-            current_close = signals["price"].iloc[i]
-            current_high = signals["high"].iloc[i]
-            current_low = signals["low"].iloc[i]
-            current_volume = signals["volume"].iloc[i]
-            avg_volume = signals["avg_volume"].iloc[i]
-            atr = signals["atr"].iloc[i]
-
+        for (
+            i,
+            current_close,
+            current_high,
+            current_low,
+            current_volume,
+            avg_volume,
+            atr,
+            level,
+            prev_close,
+            prev_high,
+            prev_low,
+        ) in rows:
             # Check for exit conditions if in a position
             if current_position != 0:
-                stop_loss = signals["stop_loss"].iloc[i - 1]
-                take_profit = signals["take_profit"].iloc[i - 1]
-
                 # Dynamic exit conditions based on ATR and price action
                 if current_position > 0:
                     trailing_stop = max(
                         stop_loss, current_high - atr * self.atr_multiplier
                     )
                     if current_low <= trailing_stop or current_high >= take_profit:
-                        signals.loc[signals.index[i], "signal"] = -current_position
+                        signal[i] = -current_position
                         current_position = 0
                         last_level = None
                         last_trade_time = i
 
-                        logger.info(f"Long exit signal at {signals.index[i]}")
-                        logger.info(f"Exit price: {current_close}")
-                        if current_low <= trailing_stop:
-                            logger.info("Exit reason: Stop loss hit")
+                        stop_hit = current_low <= trailing_stop
+                        if stop_hit:
                             if (
                                 last_trade_price is not None
                                 and current_low < last_trade_price
                             ):
                                 consecutive_losses += 1
-                                logger.info(f"Consecutive losses: {consecutive_losses}")
                             else:
                                 consecutive_losses = 0
                         else:
-                            logger.info("Exit reason: Take profit hit")
                             consecutive_losses = 0
+
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Long exit signal at %s, exit price: %s, reason: %s, "
+                                "consecutive losses: %d",
+                                signals.index[i],
+                                current_close,
+                                "stop loss hit" if stop_hit else "take profit hit",
+                                consecutive_losses,
+                            )
                 else:  # Short position
                     trailing_stop = min(
                         stop_loss, current_low + atr * self.atr_multiplier
                     )
                     if current_high >= trailing_stop or current_low <= take_profit:
-                        signals.loc[signals.index[i], "signal"] = -current_position
+                        signal[i] = -current_position
                         current_position = 0
                         last_level = None
                         last_trade_time = i
 
-                        logger.info(f"Short exit signal at {signals.index[i]}")
-                        logger.info(f"Exit price: {current_close}")
-                        if current_high >= trailing_stop:
-                            logger.info("Exit reason: Stop loss hit")
+                        stop_hit = current_high >= trailing_stop
+                        if stop_hit:
                             if (
                                 last_trade_price is not None
                                 and current_high > last_trade_price
                             ):
                                 consecutive_losses += 1
-                                logger.info(f"Consecutive losses: {consecutive_losses}")
                             else:
                                 consecutive_losses = 0
                         else:
-                            logger.info("Exit reason: Take profit hit")
                             consecutive_losses = 0
 
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Short exit signal at %s, exit price: %s, reason: %s, "
+                                "consecutive losses: %d",
+                                signals.index[i],
+                                current_close,
+                                "stop loss hit" if stop_hit else "take profit hit",
+                                consecutive_losses,
+                            )
+
+                # Carry the active levels forward while the position is open
+                if current_position != 0:
+                    stop_losses[i] = stop_loss
+                    take_profits[i] = take_profit
+                else:
+                    stop_loss = take_profit = np.nan
+
             # Check for entry conditions if not in a position
             elif current_position == 0:
                 # Skip trading if too many consecutive losses or too soon after last trade
@@ -279,17 +327,12 @@ class BreakoutStrategy(BaseStrategy):
                 ):
                     continue
 
-                # Get current level
-                level = signals["resistance_level"].iloc[i]
-
                 # Only consider new levels
-                if level != last_level and level != 0:
+                if not math.isnan(level) and level != last_level:
                     # Calculate breakout metrics
-                    breakout_size = abs(current_close - signals["price"].iloc[i - 1])
+                    breakout_size = abs(current_close - prev_close)
                     volume_increase = current_volume / avg_volume
-                    price_momentum = (
-                        current_close - signals["price"].iloc[i - 1]
-                    ) / signals["price"].iloc[i - 1]
+                    price_momentum = (current_close - prev_close) / prev_close
 
                     # Calculate volatility-adjusted thresholds
                     volatility_factor = min(1.5, max(0.8, atr / current_close * 100))
@@ -300,29 +343,33 @@ class BreakoutStrategy(BaseStrategy):
                     min_momentum = self.min_momentum * volatility_factor
 
                     # Log entry conditions
-                    logger.info(f"\nAnalyzing potential entry at {signals.index[i]}")
-                    logger.info(f"Current close: {current_close}")
-                    logger.info(f"Level: {level}")
-                    logger.info(
-                        f"Breakout size: {breakout_size} (min: {min_breakout_size})"
-                    )
-                    logger.info(
-                        f"Volume increase: {volume_increase:.2f}x (min: {min_volume_increase:.2f}x)"
-                    )
-                    logger.info(
-                        f"Price momentum: {price_momentum:.4f} (min: {min_momentum:.4f})"
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Analyzing potential entry at %s: close=%s level=%s "
+                            "breakout size=%s (min: %s) "
+                            "volume increase=%.2fx (min: %.2fx) "
+                            "price momentum=%.4f (min: %.4f)",
+                            signals.index[i],
+                            current_close,
+                            level,
+                            breakout_size,
+                            min_breakout_size,
+                            volume_increase,
+                            min_volume_increase,
+                            price_momentum,
+                            min_momentum,
+                        )
 
                     # Check for long entry (resistance breakout)
                     if (
                         level == 1
-                        and current_close > signals["high"].iloc[i - 1]
+                        and current_close > prev_high
                         and volume_increase > min_volume_increase
                         and breakout_size > min_breakout_size
                         and price_momentum > min_momentum
                     ):
 
-                        signals.loc[signals.index[i], "signal"] = 1
+                        signal[i] = 1
                         current_position = 1
                         last_level = level
                         last_trade_price = current_close
@@ -338,28 +385,29 @@ class BreakoutStrategy(BaseStrategy):
                             current_close * self.profit_target * volatility_factor,
                         )
 
-                        signals.loc[signals.index[i], "stop_loss"] = (
-                            current_close - stop_distance
-                        )
-                        signals.loc[signals.index[i], "take_profit"] = (
-                            current_close + profit_distance
-                        )
+                        stop_loss = current_close - stop_distance
+                        take_profit = current_close + profit_distance
+                        stop_losses[i] = stop_loss
+                        take_profits[i] = take_profit
 
-                        logger.info("Long entry signal generated!")
-                        logger.info(f"Entry price: {current_close}")
-                        logger.info(f"Stop loss: {current_close - stop_distance}")
-                        logger.info(f"Take profit: {current_close + profit_distance}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Long entry signal: price=%s stop loss=%s take profit=%s",
+                                current_close,
+                                stop_loss,
+                                take_profit,
+                            )
 
                     # Check for short entry (support breakdown)
                     elif (
                         level == -1
-                        and current_close < signals["low"].iloc[i - 1]
+                        and current_close < prev_low
                         and volume_increase > min_volume_increase
                         and breakout_size > min_breakout_size
                         and price_momentum < -min_momentum
                     ):
 
-                        signals.loc[signals.index[i], "signal"] = -1
+                        signal[i] = -1
                         current_position = -1
                         last_level = level
                         last_trade_price = current_close
@@ -375,25 +423,29 @@ class BreakoutStrategy(BaseStrategy):
                             current_close * self.profit_target * volatility_factor,
                         )
 
-                        signals.loc[signals.index[i], "stop_loss"] = (
-                            current_close + stop_distance
-                        )
-                        signals.loc[signals.index[i], "take_profit"] = (
-                            current_close - profit_distance
-                        )
-
-                        logger.info("Short entry signal generated!")
-                        logger.info(f"Entry price: {current_close}")
-                        logger.info(f"Stop loss: {current_close + stop_distance}")
-                        logger.info(f"Take profit: {current_close - profit_distance}")
-
-            # Update position
-            signals.loc[signals.index[i], "position"] = current_position
+                        stop_loss = current_close + stop_distance
+                        take_profit = current_close - profit_distance
+                        stop_losses[i] = stop_loss
+                        take_profits[i] = take_profit
+
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Short entry signal: price=%s stop loss=%s take profit=%s",
+                                current_close,
+                                stop_loss,
+                                take_profit,
+                            )
+
+        # Entries are +/-1 and exits flatten, so position is the running sum
+        signals["signal"] = signal
+        signals["position"] = np.cumsum(signal, dtype=np.int8)
+        signals["stop_loss"] = stop_losses
+        signals["take_profit"] = take_profits
 
         # Log final statistics
-        total_entries = (signals["signal"] != 0).sum()
-        long_entries = (signals["signal"] == 1).sum()
-        short_entries = (signals["signal"] == -1).sum()
+        long_entries = int((signal == 1).sum())
+        short_entries = int((signal == -1).sum())
+        total_entries = long_entries + short_entries
         logger.info(f"\nStrategy Statistics:")
         logger.info(f"Total entries: {total_entries}")
         logger.info(f"Long entries: {long_entries}")
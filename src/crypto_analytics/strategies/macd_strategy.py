@@ -1,9 +1,11 @@
 """MACD trading strategy implementation."""
 
 import pandas as pd
-from typing import Dict, Optional
+import numpy as np
+from typing import Any, Dict, Optional
 from .base_strategy import BaseStrategy
 from ..indicators import MACD
+from ..utils.rolling import rolling_sum
 
 
 class MACDStrategy(BaseStrategy):
@@ -17,6 +19,37 @@ class MACDStrategy(BaseStrategy):
         """
         super().__init__([MACD(params)])
 
+    def generate_signals_batch(self, closes: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """Generate trading signals for several symbols sharing one index.
+
+        MACD values for all symbols are calculated in one batched pass; signal
+        rules and performance are then evaluated per symbol.
+
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+
+        Returns:
+            Dictionary mapping each symbol to its signal generation results
+        """
+        if closes.empty:
+            raise ValueError("Input data is empty")
+
+        macd = self.indicators[0].calculate_batch(closes)
+        results = {}
+        for symbol in closes.columns:
+            columns = {
+                "price": closes[symbol],
+                "signal": np.zeros(len(closes), dtype=np.int8),  # No position
+            }
+            for col, values in macd[symbol].items():
+                columns[col] = values
+
+            result = self._evaluate_signals(pd.DataFrame(columns, index=closes.index))
+            result["symbol"] = symbol
+            results[symbol] = result
+
+        return results
+
     def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on MACD.
 
@@ -27,45 +60,63 @@ class MACDStrategy(BaseStrategy):
             DataFrame with updated signal column
         """
         # Calculate trend direction using MACD line
-        signals["trend"] = signals["macd_line"].rolling(window=5).mean()
+        macd_line = signals["macd_line"].to_numpy()
+        trend = rolling_sum(macd_line, 5) / 5
+        signals["trend"] = trend
 
-        # Generate signals based on MACD crossovers
-        crossover = signals["macd_line"] - signals["signal_line"]
-        prev_crossover = crossover.shift(1)
+        # Generate signals based on MACD crossovers, comparing each bar with
+        # the previous one through offset slices
+        crossover = macd_line - signals["signal_line"].to_numpy()
+        histogram = signals["histogram"].to_numpy()
 
         # Buy signals: MACD line crosses above signal line
-        buy_signals = (
-            (crossover > 0)
-            & (prev_crossover < 0)
+        buy_signals = np.zeros(len(signals), dtype=bool)
+        buy_signals[1:] = (
+            (crossover[1:] > 0)
+            & (crossover[:-1] < 0)
             & (  # Additional conditions for stronger signals
-                (signals["histogram"] > 0)  # Positive momentum
-                | (signals["trend"] > 0)  # Uptrend
+                (histogram[1:] > 0)  # Positive momentum
+                | (trend[1:] > 0)  # Uptrend
             )
         )
-        signals.loc[buy_signals, "signal"] = 1
 
         # Sell signals: MACD line crosses below signal line
-        sell_signals = (
-            (crossover < 0)
-            & (prev_crossover > 0)
+        sell_signals = np.zeros(len(signals), dtype=bool)
+        sell_signals[1:] = (
+            (crossover[1:] < 0)
+            & (crossover[:-1] > 0)
             & (  # Additional conditions for stronger signals
-                (signals["histogram"] < 0)  # Negative momentum
-                | (signals["trend"] < 0)  # Downtrend
+                (histogram[1:] < 0)  # Negative momentum
+                | (trend[1:] < 0)  # Downtrend
             )
         )
-        signals.loc[sell_signals, "signal"] = -1
 
-        # Calculate current position
-        signals["position"] = signals["signal"].cumsum()
+        # Entries fit in int8, but reversal exits write -position, so widen.
+        # Frames without a signal column leave bars with no entry unset (NaN)
+        if "signal" in signals.columns:
+            signal = signals["signal"].to_numpy(dtype=np.int32)
+        else:
+            signal = np.full(len(signals), np.nan)
+        signal[buy_signals] = 1
+        signal[sell_signals] = -1
+
+        # Calculate current position, skipping unset bars
+        if signal.dtype == np.int32:
+            position = np.cumsum(signal, dtype=np.int32)
+        else:
+            position = np.nancumsum(signal)
+            position[np.isnan(signal)] = np.nan
 
         # Exit positions on strong trend reversal
-        trend_reversal = (signals["position"] > 0) & (  # Long position
-            signals["trend"] < -signals["trend"].std()
-        ) | (  # Strong downtrend
-            signals["position"] < 0
-        ) & (  # Short position
-            signals["trend"] > signals["trend"].std()
-        )  # Strong uptrend
-        signals.loc[trend_reversal, "signal"] = -signals.loc[trend_reversal, "position"]
+        trend_std = np.nanstd(trend, ddof=1)
+        trend_reversal = (
+            (position > 0) & (trend < -trend_std)  # Long position, strong downtrend
+        ) | (
+            (position < 0) & (trend > trend_std)  # Short position, strong uptrend
+        )
+        signal[trend_reversal] = -position[trend_reversal]
+
+        signals["signal"] = signal
+        signals["position"] = position
 
         return signals
@@ -2,20 +2,101 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import json
 from datetime import datetime
-from sklearn.ensemble import GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import HistGradientBoostingClassifier
 from .base_strategy import BaseStrategy
 from .macd_strategy import MACDStrategy
 from .bollinger_strategy import BollingerStrategy
 from ..indicators import MACD, BollingerBands
+from ..utils.exits import level_exits
+from ..utils.rolling import pct_change, rolling_mean_std, rolling_sum
+
+
+def _double_window_sum(window_sum: np.ndarray, window: int) -> np.ndarray:
+    """Turn trailing sums over window bars into sums over 2 * window bars."""
+    doubled = np.full(len(window_sum), np.nan)
+    doubled[window:] = window_sum[window:] + window_sum[:-window]
+    return doubled
+
+
+def _double_window_std(
+    mean: np.ndarray, std: np.ndarray, window: int
+) -> np.ndarray:
+    """Turn trailing sample stds over window bars into stds over 2 * window bars.
+
+    The two halves are merged with the pairwise variance update of Chan et al.,
+    which stays stable when their means differ; window must be at least 2.
+    """
+    doubled = np.full(len(std), np.nan)
+    squares = std * std * (window - 1)
+    mean_gap = mean[window:] - mean[:-window]
+    doubled[window:] = np.sqrt(
+        (squares[window:] + squares[:-window] + mean_gap * mean_gap * window / 2)
+        / (2 * window - 1)
+    )
+    return doubled
+
+
+def _rolling_count(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum of small integer values, such as +1/-1 flags.
+
+    Integer-valued cumulative sums are exact in float64, so each window sum is
+    a difference of two running totals rather than a fold over the window.
+    """
+    if window < 1:
+        raise ValueError("Window must be a positive integer")
+
+    result = np.full(len(values), np.nan)
+    if window <= len(values):
+        total = np.cumsum(values)
+        result[window - 1] = total[window - 1]
+        result[window:] = total[window:] - total[:-window]
+    return result
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Standard deviation with ddof=1, NaN for fewer than two values."""
+    return values.std(ddof=1) if len(values) > 1 else np.nan
 
 
 class MLStrategyCombiner(BaseStrategy):
     """ML-based strategy combiner using gradient boosting."""
 
+    # Price, volume and candlestick features, after the indicator and strategy
+    # signal columns
+    _MARKET_FEATURES = (
+        "returns",
+        "log_returns",
+        "volatility",
+        "volatility_long",
+        "volatility_ratio",
+        *(
+            f"{kind}_{period}"
+            for period in (5, 10, 20, 30)
+            for kind in ("momentum", "volume_momentum")
+        ),
+        "trend",
+        "trend_strength",
+        "trend_consistency",
+        "price_distance_ma_5",
+        "price_distance_ma_10",
+        "price_distance_ma_20",
+        "volume_trend",
+        "volume_ma",
+        "relative_volume",
+        "volume_trend_strength",
+        "body_size",
+        "upper_shadow",
+        "lower_shadow",
+        "body_upper_ratio",
+        "body_lower_ratio",
+        "daily_range",
+        "range_ma",
+        "relative_range",
+    )
+
     def __init__(
         self,
         lookback_period: int = 30,
@@ -23,6 +104,7 @@ class MLStrategyCombiner(BaseStrategy):
         position_size: float = 1.0,
         stop_loss: float = 0.015,
         take_profit: float = 0.035,
+        save_results: bool = False,
     ):
         """Initialize ML strategy combiner.
 
@@ -32,6 +114,7 @@ class MLStrategyCombiner(BaseStrategy):
             position_size: Maximum position size
             stop_loss: Stop loss percentage
             take_profit: Take profit percentage
+            save_results: Whether backtest writes its metrics to results/
         """
         super().__init__()
         self.lookback_period = lookback_period
@@ -39,6 +122,7 @@ class MLStrategyCombiner(BaseStrategy):
         self.position_size = position_size
         self.stop_loss = stop_loss
         self.take_profit = take_profit
+        self.save_results = save_results
 
         # Initialize strategies
         self.strategies = {
@@ -61,16 +145,19 @@ class MLStrategyCombiner(BaseStrategy):
         ]
 
         # Initialize ML model with optimized parameters
-        self.model = GradientBoostingClassifier(
-            n_estimators=200,  # More trees for better accuracy
+        # Histogram splits bin each feature once, so training scales with
+        # the number of bins rather than sorted samples; trees are invariant
+        # to feature scaling, so no scaler is needed
+        self.model = HistGradientBoostingClassifier(
+            max_iter=200,  # More trees for better accuracy
             learning_rate=0.05,  # Slower learning rate for better generalization
             max_depth=4,  # Slightly deeper trees
-            subsample=0.8,  # Random sampling of training data
-            min_samples_split=20,  # Prevent overfitting
             min_samples_leaf=10,  # Prevent overfitting
+            l2_regularization=1.0,  # Prevent overfitting
+            early_stopping="auto",  # Hold out 10% once there is enough data
+            validation_fraction=0.1,
             random_state=42,
         )
-        self.scaler = StandardScaler()
         self.is_trained = False
 
     def prepare_features(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -82,98 +169,183 @@ class MLStrategyCombiner(BaseStrategy):
         Returns:
             DataFrame with features
         """
-        features = pd.DataFrame(index=data.index)
+        matrix, names = self._feature_matrix(data)
+        return pd.DataFrame(matrix, index=data.index, columns=names)
+
+    def _compute_indicators(
+        self, data: pd.DataFrame
+    ) -> Dict[str, Union[pd.DataFrame, pd.Series]]:
+        """Calculate every indicator once for reuse across features and signals.
+
+        Args:
+            data: DataFrame with OHLCV data
+
+        Returns:
+            Dict mapping indicator class names to their output
+        """
+        return {
+            indicator.__class__.__name__: indicator.calculate(data)
+            for indicator in self.indicators
+        }
+
+    @staticmethod
+    def _indicator_columns(
+        indicators: Dict[str, Union[pd.DataFrame, pd.Series]],
+    ) -> Dict[str, pd.Series]:
+        """Flatten indicator outputs into named columns.
+
+        Args:
+            indicators: Indicator outputs from _compute_indicators
+
+        Returns:
+            Dict mapping column names to indicator values
+        """
+        columns = {}
+        for name, indicator_data in indicators.items():
+            if isinstance(indicator_data, pd.DataFrame):
+                for col in indicator_data.columns:
+                    columns[col] = indicator_data[col]
+            else:
+                columns[name] = indicator_data
+        return columns
+
+    def _feature_matrix(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[Dict[str, Union[pd.DataFrame, pd.Series]]] = None,
+    ) -> Tuple[np.ndarray, List[str]]:
+        """Build the feature matrix used for training and prediction.
+
+        Every feature is written straight into one preallocated float64
+        matrix, so the model gets an ndarray without going through a
+        DataFrame.
+
+        Args:
+            data: DataFrame with OHLCV data
+            indicators: Optional indicator outputs already calculated from data
+
+        Returns:
+            tuple: (matrix, feature names), NaN forward filled then zeroed
+        """
+        if indicators is None:
+            indicators = self._compute_indicators(data)
 
         # Add technical indicator features
-        signals = data.copy()
+        signals = data.assign(**self._indicator_columns(indicators))
         signals["price"] = signals["close"]
-
-        # Calculate indicator features
-        for indicator in self.indicators:
-            indicator_data = indicator.calculate(data)
+        leading = []
+        for name, indicator_data in indicators.items():
             if isinstance(indicator_data, pd.DataFrame):
                 for col in indicator_data.columns:
-                    signals[col] = indicator_data[col]
-                    features[f"{indicator.__class__.__name__}_{col}"] = indicator_data[
-                        col
-                    ]
+                    leading.append((f"{name}_{col}", indicator_data[col]))
             else:
-                signals[indicator.__class__.__name__] = indicator_data
-                features[indicator.__class__.__name__] = indicator_data
+                leading.append((name, indicator_data))
 
         # Add strategy signals
         for name, strategy in self.strategies.items():
             strategy_signals = strategy.generate_signal_rules(signals)
-            features[f"{name}_signal"] = strategy_signals["signal"]
-
-        # Enhanced price-based features
-        features["returns"] = data["close"].pct_change(fill_method=None)
-        features["log_returns"] = np.log1p(data["close"]).diff()
-
-        # Volatility features
-        returns = features["returns"]
-        features["volatility"] = returns.rolling(self.lookback_period).std()
-        features["volatility_long"] = returns.rolling(self.lookback_period * 2).std()
-        features["volatility_ratio"] = (
-            features["volatility"] / features["volatility_long"]
-        )
-
-        # Momentum features
-        for period in [5, 10, 20, 30]:
-            features[f"momentum_{period}"] = data["close"].pct_change(
-                period, fill_method=None
-            )
-            features[f"volume_momentum_{period}"] = data["volume"].pct_change(
-                period, fill_method=None
-            )
-
-        # Trend features
-        features["trend"] = np.where(data["close"] > data["close"].shift(1), 1, -1)
-        features["trend_strength"] = (
-            features["trend"].rolling(self.lookback_period).mean()
-        )
-        features["trend_consistency"] = abs(features["trend_strength"])
-
-        # Price level features
-        for period in [5, 10, 20]:
-            features[f"price_distance_ma_{period}"] = (
-                data["close"] - data["close"].rolling(period).mean()
-            ) / data["close"].rolling(period).mean()
-
-        # Volume features
-        features["volume_trend"] = data["volume"].pct_change(fill_method=None)
-        features["volume_ma"] = data["volume"].rolling(self.lookback_period).mean()
-        features["relative_volume"] = data["volume"] / features["volume_ma"]
-        features["volume_trend_strength"] = (
-            features["volume_trend"].rolling(self.lookback_period).mean()
-        )
-
-        # Candlestick features
-        features["body_size"] = abs(data["close"] - data["open"]) / data["open"]
-        features["upper_shadow"] = (
-            data["high"] - data[["open", "close"]].max(axis=1)
-        ) / data["open"]
-        features["lower_shadow"] = (
-            data[["open", "close"]].min(axis=1) - data["low"]
-        ) / data["open"]
-        features["body_upper_ratio"] = features["body_size"] / features[
-            "upper_shadow"
-        ].replace(0, np.nan)
-        features["body_lower_ratio"] = features["body_size"] / features[
-            "lower_shadow"
-        ].replace(0, np.nan)
-
-        # Range features
-        features["daily_range"] = (data["high"] - data["low"]) / data["open"]
-        features["range_ma"] = (
-            features["daily_range"].rolling(self.lookback_period).mean()
-        )
-        features["relative_range"] = features["daily_range"] / features["range_ma"]
+            leading.append((f"{name}_signal", strategy_signals["signal"]))
+
+        names = [name for name, _ in leading] + list(self._MARKET_FEATURES)
+        column = {name: i for i, name in enumerate(names)}
+        features = np.empty((len(data), len(names)), order="F")
+        for name, values in leading:
+            features[:, column[name]] = values
+
+        def put(name: str, values: np.ndarray) -> None:
+            features[:, column[name]] = values
+
+        open_ = data["open"].to_numpy(dtype=np.float64)
+        high = data["high"].to_numpy(dtype=np.float64)
+        low = data["low"].to_numpy(dtype=np.float64)
+        close = data["close"].to_numpy(dtype=np.float64)
+        volume = data["volume"].to_numpy(dtype=np.float64)
+        lookback = self.lookback_period
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Enhanced price-based features
+            returns = pct_change(close, 1)
+            log_close = np.log1p(close)
+            log_returns = np.full(len(close), np.nan)
+            log_returns[1:] = log_close[1:] - log_close[:-1]
+            put("returns", returns)
+            put("log_returns", log_returns)
+
+            # Volatility features
+            # The long window is two adjacent lookback windows, so its std is
+            # combined from their stats instead of rescanning 2 * lookback bars
+            volatility_mean, volatility = rolling_mean_std(returns, lookback)
+            if lookback > 1:
+                volatility_long = _double_window_std(
+                    volatility_mean, volatility, lookback
+                )
+            else:
+                volatility_long = rolling_mean_std(returns, 2)[1]
+            put("volatility", volatility)
+            put("volatility_long", volatility_long)
+            put("volatility_ratio", volatility / volatility_long)
+
+            # Momentum features
+            for period in [5, 10, 20, 30]:
+                put(f"momentum_{period}", pct_change(close, period))
+                put(f"volume_momentum_{period}", pct_change(volume, period))
+
+            # Trend features
+            trend = np.full(len(close), -1.0)
+            trend[1:][close[1:] > close[:-1]] = 1.0
+            trend_strength = _rolling_count(trend, lookback) / lookback
+            put("trend", trend)
+            put("trend_strength", trend_strength)
+            put("trend_consistency", np.abs(trend_strength))
+
+            # Price level features; each longer window sum adds two adjacent
+            # sums of half its length instead of folding every bar again
+            close_sum = rolling_sum(close, 5)
+            for period in [5, 10, 20]:
+                if period > 5:
+                    close_sum = _double_window_sum(close_sum, period // 2)
+                close_ma = close_sum / period
+                put(f"price_distance_ma_{period}", (close - close_ma) / close_ma)
+
+            # Volume features
+            volume_trend = pct_change(volume, 1)
+            volume_ma = rolling_sum(volume, lookback) / lookback
+            put("volume_trend", volume_trend)
+            put("volume_ma", volume_ma)
+            put("relative_volume", volume / volume_ma)
+            put("volume_trend_strength", rolling_sum(volume_trend, lookback) / lookback)
+
+            # Candlestick features; fmax/fmin skip a missing open or close
+            body_size = np.abs(close - open_) / open_
+            upper_shadow = (high - np.fmax(open_, close)) / open_
+            lower_shadow = (np.fmin(open_, close) - low) / open_
+            put("body_size", body_size)
+            put("upper_shadow", upper_shadow)
+            put("lower_shadow", lower_shadow)
+            for name, shadow in (
+                ("body_upper_ratio", upper_shadow),
+                ("body_lower_ratio", lower_shadow),
+            ):
+                # Divide straight into the column, leaving zero shadows NaN
+                ratio = features[:, column[name]]
+                ratio.fill(np.nan)
+                np.divide(body_size, shadow, out=ratio, where=shadow != 0)
+
+            # Range features
+            daily_range = (high - low) / open_
+            range_ma = rolling_sum(daily_range, lookback) / lookback
+            put("daily_range", daily_range)
+            put("range_ma", range_ma)
+            put("relative_range", daily_range / range_ma)
 
         # Handle NaN values with forward fill then zero
-        features = features.ffill().fillna(0)
+        missing = np.isnan(features)
+        last_valid = np.where(missing, 0, np.arange(len(features))[:, None])
+        np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+        features = np.take_along_axis(features, last_valid, axis=0)
+        features[np.isnan(features)] = 0.0
 
-        return features
+        return np.ascontiguousarray(features), names
 
     def prepare_labels(self, data: pd.DataFrame) -> pd.Series:
         """Prepare labels for ML model training with enhanced logic.
@@ -184,54 +356,54 @@ class MLStrategyCombiner(BaseStrategy):
         Returns:
             Series with labels (1 for up, -1 for down, 0 for hold)
         """
-        # Calculate forward returns for multiple periods
-        future_returns = pd.Series(0, index=data.index)
+        close = data["close"].to_numpy(dtype=np.float64)
+        future_returns = np.zeros(len(close))
 
         # Weight different time horizons
         weights = {1: 0.4, 2: 0.3, 3: 0.2, 5: 0.1}
 
         for period, weight in weights.items():
-            period_returns = (
-                data["close"]
-                .shift(-period)
-                .pct_change(period, fill_method=None)
-                .shift(period)
-            )
+            # Return over the period ending at each bar; the first 2 * period
+            # bars stay NaN as with the shift/pct_change/shift chain
+            period_returns = pct_change(close, period)
+            period_returns[: 2 * period] = np.nan
             future_returns += period_returns * weight
 
-        labels = pd.Series(0, index=data.index)
-
         # Dynamic thresholds based on volatility
-        volatility = data["close"].pct_change(fill_method=None).rolling(20).std()
+        volatility = pd.Series(pct_change(close, 1)).rolling(20).std().to_numpy()
         up_threshold = self.prediction_threshold / 100 + volatility
         down_threshold = -self.prediction_threshold / 100 - volatility
 
         # Generate labels with dynamic thresholds
+        labels = np.zeros(len(close), dtype=np.int64)
         labels[future_returns > up_threshold] = 1
         labels[future_returns < down_threshold] = -1
 
-        return labels
+        return pd.Series(labels, index=data.index)
 
-    def train(self, data: pd.DataFrame) -> None:
+    def train(
+        self, data: pd.DataFrame, features: Optional[np.ndarray] = None
+    ) -> None:
         """Train the ML model.
 
         Args:
             data: DataFrame with OHLCV data
+            features: Optional feature matrix already prepared from data
         """
-        features = self.prepare_features(data)
+        if features is None:
+            features, _ = self._feature_matrix(data)
+        features = np.asarray(features, dtype=np.float64)
         labels = self.prepare_labels(data)
 
-        # Remove NaN values
-        valid_idx = ~(features.isna().any(axis=1) | labels.isna())
-        features = features[valid_idx]
-        labels = labels[valid_idx]
-
-        # Scale features
-        self.scaler.fit(features)
-        scaled_features = self.scaler.transform(features)
+        # Remove NaN values; prepared features are already filled, so the
+        # matrix is only copied when a caller passes rows with gaps
+        valid_idx = ~(np.isnan(features).any(axis=1) | labels.isna().to_numpy())
+        if not valid_idx.all():
+            features = features[valid_idx]
+            labels = labels[valid_idx]
 
         # Train model
-        self.model.fit(scaled_features, labels)
+        self.model.fit(features, labels)
         self.is_trained = True
 
     def generate_signal_rules(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -243,45 +415,86 @@ class MLStrategyCombiner(BaseStrategy):
         Returns:
             DataFrame with signals and positions
         """
+        # Prepare features once for both training and prediction
+        features, _ = self._feature_matrix(data)
         if not self.is_trained:
-            self.train(data)
+            self.train(data, features)
 
-        # Prepare features and generate predictions
-        features = self.prepare_features(data)
-        scaled_features = self.scaler.transform(features)
-        predictions = self.model.predict(scaled_features)
-        probabilities = self.model.predict_proba(scaled_features)
-
-        # Initialize signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals["signal"] = pd.Series(0, index=data.index)
-        signals["position"] = pd.Series(0, index=data.index)
+        # Generate predictions
+        predictions, probabilities = self._predict(features)
 
         # Generate signals based on predictions and confidence
-        for i in range(len(signals)):
-            if i < self.lookback_period:
-                continue
-
-            max_prob = np.max(probabilities[i])
-            if max_prob > self.prediction_threshold:
-                signals.iloc[i, signals.columns.get_loc("signal")] = predictions[i]
-
-            # Update position
-            if i > 0:
-                new_position = (
-                    signals.iloc[i - 1]["position"] + signals.iloc[i]["signal"]
-                )
-                signals.iloc[i, signals.columns.get_loc("position")] = np.clip(
-                    new_position, -self.position_size, self.position_size
-                )
+        signal, position = self._entry_positions(predictions, probabilities)
+
+        return pd.DataFrame({"signal": signal, "position": position}, index=data.index)
 
-        return signals
+    def _predict(self, features: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Predict classes and class probabilities in one pass over the model.
+
+        Args:
+            features: Feature matrix
+
+        Returns:
+            tuple: (predictions, probabilities) arrays
+        """
+        # predict() is the argmax of predict_proba(), so derive it instead of
+        # running every tree a second time
+        probabilities = self.model.predict_proba(features)
+        predictions = self.model.classes_[probabilities.argmax(axis=1)]
+        return predictions, probabilities
 
-    def calculate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _entry_positions(
+        self, predictions: np.ndarray, probabilities: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Turn model predictions into entry signals and clipped positions.
+
+        Args:
+            predictions: Predicted class for each bar
+            probabilities: Class probabilities for each bar
+
+        Returns:
+            tuple: (signal, position) arrays
+        """
+        # Only confident predictions after the lookback period are acted on
+        confident = probabilities.max(axis=1) > self.prediction_threshold
+        signal = np.where(confident, predictions, 0).astype(np.float64)
+        signal[: self.lookback_period] = 0.0
+
+        # Positions accumulate entries within the size limit; only bars with
+        # an entry can change the position, so walk those and hold each
+        # level until the next entry
+        changes = np.flatnonzero(signal[max(self.lookback_period, 1) :])
+        changes += max(self.lookback_period, 1)
+        levels = []
+        prev_position = 0.0
+        for entry in signal[changes].tolist():
+            prev_position = min(
+                max(prev_position + entry, -self.position_size),
+                self.position_size,
+            )
+            levels.append(prev_position)
+
+        position = np.zeros(len(signal))
+        if len(changes):
+            held = np.diff(changes, append=len(signal))
+            position[changes[0] :] = np.repeat(levels, held)
+
+        return signal, position
+
+    def calculate_signals(
+        self,
+        data: pd.DataFrame,
+        features: Optional[np.ndarray] = None,
+        indicators: Optional[Dict[str, Union[pd.DataFrame, pd.Series]]] = None,
+        include_indicators: bool = False,
+    ) -> pd.DataFrame:
         """Calculate trading signals using ML model.
 
         Args:
             data: DataFrame with OHLCV data
+            features: Optional feature matrix already prepared from data
+            indicators: Optional indicator outputs already calculated from data
+            include_indicators: Whether to add indicator columns to the output
 
         Returns:
             DataFrame with signals and positions
@@ -289,77 +502,46 @@ class MLStrategyCombiner(BaseStrategy):
         if not self.is_trained:
             raise ValueError("Model must be trained before generating signals")
 
-        # Copy input data to preserve original
-        signals = data.copy()
-
-        # Add technical indicators
-        for indicator in self.indicators:
-            indicator_data = indicator.calculate(data)
-            if isinstance(indicator_data, pd.DataFrame):
-                for col in indicator_data.columns:
-                    signals[col] = indicator_data[col]
-            else:
-                signals[indicator.__class__.__name__] = indicator_data
+        # Indicators are only needed for features the caller did not supply
+        # and for output columns that were asked for
+        if indicators is None and (features is None or include_indicators):
+            indicators = self._compute_indicators(data)
 
         # Generate predictions
-        features = self.prepare_features(data)
-        scaled_features = self.scaler.transform(features)
-        predictions = self.model.predict(scaled_features)
-        probabilities = self.model.predict_proba(scaled_features)
-
-        # Initialize signal and position columns
-        signals["signal"] = pd.Series(0, index=signals.index)
-        signals["position"] = pd.Series(0, index=signals.index)
+        if features is None:
+            features, _ = self._feature_matrix(data, indicators)
+        predictions, probabilities = self._predict(features)
 
         # Generate signals based on predictions and confidence
-        for i in range(len(signals)):
-            if i < self.lookback_period:
-                continue
-
-            max_prob = np.max(probabilities[i])
-            if max_prob > self.prediction_threshold:
-                signals.iloc[i, signals.columns.get_loc("signal")] = predictions[i]
-
-            # Update position
-            if i > 0:
-                new_position = (
-                    signals.iloc[i - 1]["position"] + signals.iloc[i]["signal"]
-                )
-                signals.iloc[i, signals.columns.get_loc("position")] = np.clip(
-                    new_position, -self.position_size, self.position_size
-                )
+        signal, position = self._entry_positions(predictions, probabilities)
 
         # Calculate returns
-        signals["returns"] = signals["close"].pct_change(fill_method=None)
-        signals["strategy_returns"] = signals["position"].shift(1) * signals["returns"]
+        close = data["close"].to_numpy(dtype=np.float64)
+        returns = pct_change(close, 1)
+        strategy_returns = np.full(len(close), np.nan)
+        strategy_returns[1:] = position[:-1] * returns[1:]
 
         # Apply stop loss and take profit
-        for i in range(1, len(signals)):
-            if signals.iloc[i - 1]["position"] != 0:
-                returns = (
-                    signals.iloc[i]["close"] - signals.iloc[i - 1]["close"]
-                ) / signals.iloc[i - 1]["close"]
-
-                if returns * signals.iloc[i - 1]["position"] <= -self.stop_loss:
-                    # Stop loss hit
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-                    signals.iloc[i, signals.columns.get_loc("strategy_returns")] = (
-                        -self.stop_loss
-                    )
-                elif returns * signals.iloc[i - 1]["position"] >= self.take_profit:
-                    # Take profit hit
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-                    signals.iloc[i, signals.columns.get_loc("strategy_returns")] = (
-                        self.take_profit
-                    )
-
-        return signals
+        stop_exits, take_exits = level_exits(
+            close, position, self.stop_loss, self.take_profit
+        )
+        exits = np.flatnonzero(stop_exits | take_exits)
+        signal[exits] = -position[exits - 1]
+        position[exits] = 0.0
+        strategy_returns[stop_exits] = -self.stop_loss
+        strategy_returns[take_exits] = self.take_profit
+
+        # Assemble the input, indicator and signal columns into one frame;
+        # input and indicator Series are shared until written to
+        columns = dict(data.items())
+        if include_indicators:
+            columns.update(self._indicator_columns(indicators))
+        columns["signal"] = signal
+        columns["position"] = position
+        columns["returns"] = returns
+        columns["strategy_returns"] = strategy_returns
+
+        return pd.DataFrame(columns, index=data.index, copy=False)
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals for the strategy.
@@ -370,10 +552,12 @@ class MLStrategyCombiner(BaseStrategy):
         Returns:
             DataFrame with signals and positions
         """
+        # Prepare features once for both training and prediction
+        features, _ = self._feature_matrix(data)
         if not self.is_trained:
-            self.train(data)
+            self.train(data, features)
 
-        return self.calculate_signals(data)
+        return self.calculate_signals(data, features)
 
     def backtest(self, data: pd.DataFrame) -> Dict:
         """Backtest the ML strategy.
@@ -401,34 +585,38 @@ class MLStrategyCombiner(BaseStrategy):
                 "trades": 0,
             }
 
-        # Calculate performance metrics
-        total_return = (1 + returns).prod() - 1
-        volatility = returns.std() * np.sqrt(252)
-        sharpe = (
-            returns.mean() / returns.std() * np.sqrt(252) if returns.std() != 0 else 0
-        )
+        # Calculate performance metrics on the raw array, reusing each
+        # intermediate instead of re-deriving it from the Series
+        returns = returns.to_numpy(dtype=np.float64)
+        mean_return = returns.mean()
+        returns_std = _sample_std(returns)
+        growth = np.cumprod(1 + returns)
+
+        total_return = growth[-1] - 1
+        volatility = returns_std * np.sqrt(252)
+        sharpe = mean_return / returns_std * np.sqrt(252) if returns_std != 0 else 0
 
-        downside_returns = returns[returns < 0]
+        losing = returns < 0
+        downside_std = _sample_std(returns[losing])
         sortino = (
-            returns.mean() * np.sqrt(252) / downside_returns.std()
-            if len(downside_returns) > 0 and downside_returns.std() != 0
+            mean_return * np.sqrt(252) / downside_std
+            if losing.any() and downside_std != 0
             else 0
         )
 
-        cum_returns = (1 + returns).cumprod()
-        rolling_max = cum_returns.expanding().max()
-        drawdowns = (cum_returns - rolling_max) / rolling_max
-        max_drawdown = drawdowns.min()
+        peak = np.maximum.accumulate(growth)
+        max_drawdown = ((growth - peak) / peak).min()
 
-        win_rate = (returns > 0).mean()
+        winning = returns > 0
+        win_rate = winning.mean()
         profit_factor = (
-            abs(returns[returns > 0].sum()) / abs(returns[returns < 0].sum())
-            if len(returns[returns < 0]) > 0
+            abs(returns[winning].sum()) / abs(returns[losing].sum())
+            if losing.any()
             else float("inf")
         )
         profit_factor = min(profit_factor, 1000.0)
 
-        trades = len(signals[signals["signal"] != 0])
+        trades = int(np.count_nonzero(signals["signal"].to_numpy() != 0))
 
         metrics = {
             "sharpe_ratio": float(sharpe),
@@ -441,11 +629,12 @@ class MLStrategyCombiner(BaseStrategy):
             "trades": trades,
         }
 
-        # Save results to JSON
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_file = f"results/ml_strategy_results_{timestamp}.json"
+        # Save results to JSON when requested; sweeps skip the file IO
+        if self.save_results:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            results_file = f"results/ml_strategy_results_{timestamp}.json"
 
-        with open(results_file, "w") as f:
-            json.dump(metrics, f, indent=4)
+            with open(results_file, "w") as f:
+                json.dump(metrics, f, indent=4)
 
         return metrics
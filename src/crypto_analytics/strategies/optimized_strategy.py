@@ -54,58 +54,57 @@ class OptimizedStrategy(BaseStrategy):
         macd_data = self.macd.calculate(signals)
         bb_data = self.bollinger.calculate(signals)
 
+        # Resolve parameters once instead of per bar
         lookback = self.params["lookback_period"]
-
-        for i in range(lookback, len(signals)):
-            # Calculate combined signal
-            macd_signal = (
-                macd_data["macd_line"].iloc[i]
-                * self.params["indicator_weights"]["macd"]
-            )
-            bb_signal = (
-                bb_data["bandwidth"].iloc[i]
-                * self.params["indicator_weights"]["bollinger"]
-            )
-            combined_signal = macd_signal + bb_signal
-
-            # Generate entry signals
-            if combined_signal < self.params["entry_thresholds"]["oversold"]:
-                signals.iloc[i, signals.columns.get_loc("signal")] = 1
-            elif combined_signal > self.params["entry_thresholds"]["overbought"]:
-                signals.iloc[i, signals.columns.get_loc("signal")] = -1
-
+        macd_weight = self.params["indicator_weights"]["macd"]
+        bollinger_weight = self.params["indicator_weights"]["bollinger"]
+        oversold = self.params["entry_thresholds"]["oversold"]
+        overbought = self.params["entry_thresholds"]["overbought"]
+        position_size = self.params["position_size"]
+        stop_loss = self.params["stop_loss"]
+        take_profit = self.params["take_profit"]
+
+        # Entry signals from the combined indicator score, vectorized
+        combined_signal = (
+            macd_data["macd_line"].to_numpy(dtype=np.float64) * macd_weight
+            + bb_data["bandwidth"].to_numpy(dtype=np.float64) * bollinger_weight
+        )
+        entry = np.where(
+            combined_signal < oversold,
+            1.0,
+            np.where(combined_signal > overbought, -1.0, 0.0),
+        )
+        entry[:lookback] = 0.0
+
+        # Bar returns for the stop loss and take profit checks
+        price = signals["price"].to_numpy(dtype=np.float64)
+        bar_returns = np.full(len(price), np.nan)
+        bar_returns[1:] = (price[1:] - price[:-1]) / price[:-1]
+
+        # Positions depend on the previous bar, so walk them over Python floats
+        signal = entry.tolist()
+        bar_returns = bar_returns.tolist()
+        position = [0.0] * len(signal)
+        prev_position = 0.0
+
+        for i in range(lookback, len(signal)):
             # Update position
-            new_position = signals.iloc[i - 1]["position"] + signals.iloc[i]["signal"]
-            signals.iloc[i, signals.columns.get_loc("position")] = np.clip(
-                new_position,
-                -self.params["position_size"],
-                self.params["position_size"],
+            new_position = min(
+                max(prev_position + signal[i], -position_size), position_size
             )
 
             # Check for stop loss and take profit
-            if signals.iloc[i - 1]["position"] != 0:
-                returns = (
-                    signals.iloc[i]["price"] - signals.iloc[i - 1]["price"]
-                ) / signals.iloc[i - 1]["price"]
-
-                if (
-                    returns * signals.iloc[i - 1]["position"]
-                    <= -self.params["stop_loss"]
-                ):
-                    # Stop loss hit
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-                elif (
-                    returns * signals.iloc[i - 1]["position"]
-                    >= self.params["take_profit"]
-                ):
-                    # Take profit hit
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
+            if prev_position != 0:
+                move = bar_returns[i] * prev_position
+                if move <= -stop_loss or move >= take_profit:
+                    signal[i] = -prev_position
+                    new_position = 0.0
+
+            position[i] = new_position
+            prev_position = new_position
+
+        signals["signal"] = signal
+        signals["position"] = position
 
         # Calculate returns
         signals["returns"] = signals["price"].pct_change()
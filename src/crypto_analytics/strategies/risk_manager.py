@@ -2,8 +2,21 @@
 
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
 from dataclasses import dataclass
+from ..utils.exits import level_exits
+from ..utils.rolling import rolling_max, rolling_mean_std, rolling_min
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Mean of the non-NaN values, NaN when there are none."""
+    valid = values[~np.isnan(values)]
+    return float(valid.mean()) if len(valid) else np.nan
+
+
+def _clip(value: float, lower: float, upper: float) -> float:
+    """Clip a scalar without ufunc dispatch; NaN passes through as in np.clip."""
+    return min(max(value, lower), upper)
 
 
 @dataclass
@@ -54,12 +67,12 @@ class AdaptiveRiskManager:
         self.kelly_fraction = kelly_fraction
 
     def calculate_kelly_fraction(
-        self, historical_returns: pd.Series, win_rate: float
+        self, historical_returns: Union[pd.Series, np.ndarray], win_rate: float
     ) -> float:
         """Calculate optimal Kelly fraction.
 
         Args:
-            historical_returns: Series of historical returns
+            historical_returns: Series or array of historical returns
             win_rate: Historical win rate
 
         Returns:
@@ -69,6 +82,7 @@ class AdaptiveRiskManager:
             return 0.0
 
         # Calculate average win and loss sizes
+        historical_returns = np.asarray(historical_returns, dtype=np.float64)
         wins = historical_returns[historical_returns > 0]
         losses = historical_returns[historical_returns < 0]
 
@@ -88,11 +102,13 @@ class AdaptiveRiskManager:
         kelly = max(0.0, min(1.0, kelly * self.kelly_fraction))
         return kelly
 
-    def calculate_volatility_factor(self, returns: pd.Series) -> float:
+    def calculate_volatility_factor(
+        self, returns: Union[pd.Series, np.ndarray]
+    ) -> float:
         """Calculate volatility scaling factor.
 
         Args:
-            returns: Series of returns
+            returns: Series or array of returns
 
         Returns:
             Volatility scaling factor
@@ -101,24 +117,24 @@ class AdaptiveRiskManager:
             return 1.0
 
         # Calculate rolling volatility
-        vol = returns.rolling(self.lookback_period).std()
-        current_vol = vol.iloc[-1]
-        avg_vol = vol.mean()
+        _, vol = rolling_mean_std(np.asarray(returns), self.lookback_period)
+        current_vol = vol[-1]
+        avg_vol = _nanmean(vol)
 
         if avg_vol == 0:
             return 1.0
 
         # Scale factor inversely with volatility
         vol_factor = avg_vol / current_vol
-        return np.clip(vol_factor, 0.5, 2.0)
+        return _clip(vol_factor, 0.5, 2.0)
 
     def calculate_dynamic_levels(
-        self, returns: pd.Series, volatility_factor: float
+        self, returns: Union[pd.Series, np.ndarray], volatility_factor: float
     ) -> Tuple[float, float]:
         """Calculate dynamic stop-loss and take-profit levels.
 
         Args:
-            returns: Series of returns
+            returns: Series or array of returns
             volatility_factor: Volatility scaling factor
 
         Returns:
@@ -128,21 +144,21 @@ class AdaptiveRiskManager:
             return self.base_stop_loss, self.base_take_profit
 
         # Calculate ATR-based levels
-        high_low_range = (
-            returns.rolling(self.lookback_period).max()
-            - returns.rolling(self.lookback_period).min()
+        values = np.asarray(returns)
+        high_low_range = rolling_max(values, self.lookback_period) - rolling_min(
+            values, self.lookback_period
         )
-        atr = high_low_range.mean()
+        atr = _nanmean(high_low_range)
 
         # Scale base levels with ATR and volatility
         stop_loss = self.base_stop_loss * (1 + atr) * volatility_factor
         take_profit = self.base_take_profit * (1 + atr) * volatility_factor
 
         # Ensure reasonable limits
-        stop_loss = np.clip(
+        stop_loss = _clip(
             stop_loss, self.base_stop_loss * 0.5, self.base_stop_loss * 2.0
         )
-        take_profit = np.clip(
+        take_profit = _clip(
             take_profit, self.base_take_profit * 0.5, self.base_take_profit * 2.0
         )
 
@@ -169,7 +185,7 @@ class AdaptiveRiskManager:
             position_size *= np.sqrt(risk_ratio)
 
         # Apply limits
-        return np.clip(position_size, self.min_position_size, self.max_position_size)
+        return _clip(position_size, self.min_position_size, self.max_position_size)
 
     def get_risk_metrics(
         self, data: pd.DataFrame, signals: pd.DataFrame
@@ -183,8 +199,10 @@ class AdaptiveRiskManager:
         Returns:
             RiskMetrics object with all calculated metrics
         """
-        # Calculate historical returns and win rate
-        returns = signals["strategy_returns"].dropna()
+        # Calculate historical returns and win rate once as an array shared
+        # by the sizing calculations below
+        returns = signals["strategy_returns"].to_numpy(dtype=np.float64)
+        returns = returns[~np.isnan(returns)]
         win_rate = (returns > 0).mean() if len(returns) > 0 else 0
 
         # Calculate Kelly fraction
@@ -230,29 +248,28 @@ class AdaptiveRiskManager:
         signals["position"] = signals["position"] * metrics.position_size
 
         # Apply stop-loss and take-profit
-        for i in range(1, len(signals)):
-            if signals.iloc[i - 1]["position"] != 0:
-                returns = (
-                    signals.iloc[i]["close"] - signals.iloc[i - 1]["close"]
-                ) / signals.iloc[i - 1]["close"]
-
-                if returns * signals.iloc[i - 1]["position"] <= -metrics.stop_loss:
-                    # Stop loss hit
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-                    signals.iloc[i, signals.columns.get_loc("strategy_returns")] = (
-                        -metrics.stop_loss
-                    )
-                elif returns * signals.iloc[i - 1]["position"] >= metrics.take_profit:
-                    # Take profit hit
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-                    signals.iloc[i, signals.columns.get_loc("strategy_returns")] = (
-                        metrics.take_profit
-                    )
+        stop_exits, take_exits = level_exits(
+            signals["close"].to_numpy(),
+            signals["position"].to_numpy(),
+            metrics.stop_loss,
+            metrics.take_profit,
+        )
+        exits = np.flatnonzero(stop_exits | take_exits)
+
+        if len(exits):
+            signal = signals["signal"].to_numpy(dtype=np.float64, copy=True)
+            position = signals["position"].to_numpy(dtype=np.float64, copy=True)
+            strategy_returns = signals["strategy_returns"].to_numpy(
+                dtype=np.float64, copy=True
+            )
+
+            signal[exits] = -position[exits - 1]
+            position[exits] = 0.0
+            strategy_returns[stop_exits] = -metrics.stop_loss
+            strategy_returns[take_exits] = metrics.take_profit
+
+            signals["signal"] = signal
+            signals["position"] = position
+            signals["strategy_returns"] = strategy_returns
 
         return signals
@@ -4,21 +4,39 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional, Union
 from .base_strategy import BaseStrategy
+from ..utils.rolling import (
+    compare_prev,
+    diff,
+    pct_change,
+    rolling_max,
+    rolling_min,
+    rolling_nanmean,
+    rolling_sum,
+)
 
 
 class SMAStrategy(BaseStrategy):
     """Trading strategy based on Simple Moving Average crossovers."""
 
-    def __init__(self, short_period: int = 50, long_period: int = 200):
+    def __init__(
+        self,
+        short_period: int = 50,
+        long_period: int = 200,
+        weighted_init: bool = True,
+    ):
         """Initialize SMA strategy.
 
         Args:
             short_period: Period for short-term SMA
             long_period: Period for long-term SMA
+            weighted_init: Whether to weight recent prices more heavily
+                before the first full window; plain partial-window means are
+                used otherwise
         """
         super().__init__()
         self.short_period = short_period
         self.long_period = long_period
+        self.weighted_init = weighted_init
 
     def calculate_sma(
         self, data: Union[pd.DataFrame, pd.Series], period: Optional[int] = None
@@ -42,19 +60,28 @@ class SMAStrategy(BaseStrategy):
         period = period or self.short_period
 
         # Calculate SMA with better price tracking
-        sma = prices.rolling(window=period, min_periods=1).mean()
+        sma = pd.Series(
+            rolling_nanmean(prices.to_numpy(), period),
+            index=prices.index,
+            name=prices.name,
+        )
 
         # For the initial period, use weighted average to better track price
-        if len(prices) >= period:
-            weights = np.linspace(
-                0.5, 1.5, period
-            )  # Increasing weights for recent prices
-            weights = weights / weights.sum()
-            for i in range(period - 1):
-                window = prices.iloc[: i + 1]
-                w = weights[-len(window) :]
-                w = w / w.sum()
-                sma.iloc[i] = np.average(window, weights=w)
+        if self.weighted_init and len(prices) >= period > 1:
+            # Row i averages prices[: i + 1] with the last i + 1 weights of
+            # linspace(0.5, 1.5, period), increasing for recent prices. A
+            # price lag bars back gets 1.5 - lag * step, so every row follows
+            # from running sums of prices and of index-weighted prices.
+            warmup = period - 1
+            step = 1.0 / warmup
+            rows = np.arange(warmup, dtype=np.float64)
+            head = prices.to_numpy(dtype=np.float64)[:warmup]
+
+            price_sum = np.cumsum(head)
+            indexed_sum = np.cumsum(rows * head)
+            weighted = 1.5 * price_sum - step * (rows * price_sum - indexed_sum)
+            total_weight = 1.5 * (rows + 1) - step * rows * (rows + 1) / 2
+            sma.iloc[:warmup] = weighted / total_weight
 
         return sma
 
@@ -69,69 +96,109 @@ class SMAStrategy(BaseStrategy):
         """
         short_sma = self.calculate_sma(data, self.short_period)
         long_sma = self.calculate_sma(data, self.long_period)
-        price = data["close"]
+        return self._signals_from_smas(data, short_sma, long_sma)
+
+    def _signals_from_smas(
+        self, data: pd.DataFrame, short_sma: pd.Series, long_sma: pd.Series
+    ) -> pd.Series:
+        """Generate trading signals from precomputed short and long SMAs.
 
-        signals = pd.Series(0, index=data.index)
+        Args:
+            data: DataFrame with 'close' price column
+            short_sma: Short-term SMA of the close
+            long_sma: Long-term SMA of the close
+
+        Returns:
+            pd.Series: Series of trading signals (1 for buy, -1 for sell, 0 for hold)
+        """
+        short_sma = short_sma.to_numpy(dtype=np.float64)
+        long_sma = long_sma.to_numpy(dtype=np.float64)
+        price = data["close"].to_numpy(dtype=np.float64)
+        price_rising = compare_prev(price, np.greater)
+        price_falling = compare_prev(price, np.less)
 
         # Calculate trend strength with more sensitive thresholds
         trend_strength = (short_sma - long_sma) / long_sma
 
         # Calculate momentum with shorter lookback
-        momentum = price.pct_change(2)  # Further reduced from 3 to 2
-        momentum_ma = momentum.rolling(
-            window=2, min_periods=1
-        ).mean()  # Further reduced from 3 to 2
+        momentum = pct_change(price, 2)  # Further reduced from 3 to 2
+        momentum_rising = compare_prev(momentum, np.greater)
+        momentum_falling = compare_prev(momentum, np.less)
+
+        momentum_ma = rolling_nanmean(momentum, 2)  # Further reduced from 3 to 2
 
         # Calculate price position
         price_above_short = price > short_sma
         price_above_long = price > long_sma
+        price_below_short = ~price_above_short
+        price_below_long = ~price_above_long
 
         # Calculate additional trend indicators
-        short_slope = short_sma.diff() / short_sma
-        long_slope = long_sma.diff() / long_sma
+        short_slope = diff(short_sma)
+        short_slope /= short_sma
+        long_slope = diff(long_sma)
+        long_slope /= long_sma
         slope_diff = short_slope - long_slope
 
         # Calculate trend acceleration
-        short_acceleration = short_slope.diff()
-        long_acceleration = long_slope.diff()
+        short_acceleration = diff(short_slope)
+
+        # Sign tests shared by several signal rules
+        trend_positive = trend_strength > 0
+        trend_negative = trend_strength < 0
+        momentum_positive = momentum > 0
+        momentum_negative = momentum < 0
+        slope_positive = short_slope > 0
+        slope_negative = short_slope < 0
+
+        # Previous-bar SMA ordering for crossovers
+        was_below = np.zeros(len(price), dtype=bool)
+        was_below[1:] = short_sma[:-1] <= long_sma[:-1]
+        was_above = np.zeros(len(price), dtype=bool)
+        was_above[1:] = short_sma[:-1] >= long_sma[:-1]
 
         # Calculate crossover signals with trend confirmation
         buy_cross = (short_sma > long_sma) & (
-            (short_sma.shift(1) <= long_sma.shift(1))  # Standard crossover
+            was_below  # Standard crossover
             | (
                 trend_strength > 0.001
             )  # Reduced threshold for trend strength confirmation
         )
         sell_cross = (short_sma < long_sma) & (
-            (short_sma.shift(1) >= long_sma.shift(1))  # Standard crossover
+            was_above  # Standard crossover
             | (
                 trend_strength < -0.001
             )  # Reduced threshold for trend strength confirmation
         )
 
-        # Calculate trend following signals with more sensitive thresholds
+        # Calculate trend following signals with more sensitive thresholds.
+        # The lenient price/momentum conditions were written as
+        # `price_above_long | momentum_ma > -0.0001`, which compares the OR
+        # of the mask and the momentum against the threshold: it always holds
+        # for buys, and for sells only holds above the long SMA while momentum
+        # is flat or missing. That behavior is kept as is.
+        momentum_flat = (momentum_ma == 0) | np.isnan(momentum_ma)
         strong_uptrend = (
             (trend_strength > 0.001)  # Further reduced threshold
             & price_above_short
-            & (price_above_long | momentum_ma > -0.0001)  # More lenient condition
             & (short_slope > -0.0001)  # More lenient slope condition
         )
         strong_downtrend = (
             (trend_strength < -0.001)  # Further reduced threshold
-            & ~price_above_short
-            & (~price_above_long | momentum_ma < 0.0001)  # More lenient condition
+            & price_below_short
+            & (price_above_long & momentum_flat)
             & (short_slope < 0.0001)  # More lenient slope condition
         )
 
         # Calculate pullback signals with more sensitive conditions
         pullback_buy = (
-            (trend_strength > 0)
-            & ~price_above_short
+            trend_positive
+            & price_below_short
             & (momentum > -0.0001)
             & (short_slope > -0.0001)
         )
         pullback_sell = (
-            (trend_strength < 0)
+            trend_negative
             & price_above_short
             & (momentum < 0.0001)
             & (short_slope < 0.0001)
@@ -139,43 +206,43 @@ class SMAStrategy(BaseStrategy):
 
         # Calculate breakout signals with shorter windows
         breakout_up = (
-            (price > short_sma.rolling(window=3).max())  # Further reduced window
+            (price > rolling_max(short_sma, 3))  # Further reduced window
             & (momentum > 0.001)  # Reduced threshold
-            & (short_slope > 0)
+            & slope_positive
         )
         breakout_down = (
-            (price < short_sma.rolling(window=3).min())  # Further reduced window
+            (price < rolling_min(short_sma, 3))  # Further reduced window
             & (momentum < -0.001)  # Reduced threshold
-            & (short_slope < 0)
+            & slope_negative
         )
 
         # Calculate trend reversal signals with more sensitive conditions
         trend_reversal_up = (
             (trend_strength < -0.01)  # Reduced threshold
             & (momentum_ma > -0.0001)  # More lenient
-            & (momentum > momentum.shift(1))
+            & momentum_rising
             & (short_slope > -0.0001)
         )
         trend_reversal_down = (
             (trend_strength > 0.01)  # Reduced threshold
             & (momentum_ma < 0.0001)  # More lenient
-            & (momentum < momentum.shift(1))
+            & momentum_falling
             & (short_slope < 0.0001)
         )
 
         # Add early trend detection signals with slope confirmation
         early_trend_up = (
             price_above_short
-            & (momentum > 0)
-            & (price > price.shift(1))
-            & (short_slope > 0)
+            & momentum_positive
+            & price_rising
+            & slope_positive
             & (slope_diff > -0.0001)
         )
         early_trend_down = (
-            ~price_above_short
-            & (momentum < 0)
-            & (price < price.shift(1))
-            & (short_slope < 0)
+            price_below_short
+            & momentum_negative
+            & price_falling
+            & slope_negative
             & (slope_diff < 0.0001)
         )
 
@@ -183,67 +250,72 @@ class SMAStrategy(BaseStrategy):
         immediate_trend_up = (
             price_above_short
             & price_above_long
-            & (momentum > 0)
-            & (short_slope > 0)
+            & momentum_positive
+            & slope_positive
             & (short_acceleration > 0)
         )
         immediate_trend_down = (
-            ~price_above_short
-            & ~price_above_long
-            & (momentum < 0)
-            & (short_slope < 0)
+            price_below_short
+            & price_below_long
+            & momentum_negative
+            & slope_negative
             & (short_acceleration < 0)
         )
 
         # Add trend continuation signals
         trend_continuation_up = (
             price_above_short
-            & (momentum > 0)
-            & (short_slope > 0)
-            & (trend_strength > 0)
+            & momentum_positive
+            & slope_positive
+            & trend_positive
             & (slope_diff > 0)
         )
         trend_continuation_down = (
-            ~price_above_short
-            & (momentum < 0)
-            & (short_slope < 0)
-            & (trend_strength < 0)
+            price_below_short
+            & momentum_negative
+            & slope_negative
+            & trend_negative
             & (slope_diff < 0)
         )
 
         # Add extreme movement signals
-        extreme_up = (
-            price.pct_change(3) > 0.02
-        )  # Price moved up more than 2% in 3 periods
-        extreme_down = (
-            price.pct_change(3) < -0.02
-        )  # Price moved down more than 2% in 3 periods
-
-        # Combine signals with priority
-        signals.loc[
-            buy_cross
-            | strong_uptrend
-            | pullback_buy
-            | breakout_up
-            | trend_reversal_up
-            | early_trend_up
-            | immediate_trend_up
-            | trend_continuation_up
-            | extreme_up
-        ] = 1
-        signals.loc[
-            sell_cross
-            | strong_downtrend
-            | pullback_sell
-            | breakout_down
-            | trend_reversal_down
-            | early_trend_down
-            | immediate_trend_down
-            | trend_continuation_down
-            | extreme_down
-        ] = -1
-
-        return signals.fillna(0)
+        change_3 = pct_change(price, 3)
+        extreme_up = change_3 > 0.02  # Price moved up more than 2% in 3 periods
+        extreme_down = change_3 < -0.02  # Price moved down more than 2% in 3 periods
+
+        # Combine signals with priority, sell conditions overriding buys
+        buy = np.logical_or.reduce(
+            [
+                buy_cross,
+                strong_uptrend,
+                pullback_buy,
+                breakout_up,
+                trend_reversal_up,
+                early_trend_up,
+                immediate_trend_up,
+                trend_continuation_up,
+                extreme_up,
+            ]
+        )
+        sell = np.logical_or.reduce(
+            [
+                sell_cross,
+                strong_downtrend,
+                pullback_sell,
+                breakout_down,
+                trend_reversal_down,
+                early_trend_down,
+                immediate_trend_down,
+                trend_continuation_down,
+                extreme_down,
+            ]
+        )
+
+        signals = np.zeros(len(data), dtype=np.int8)
+        signals[buy] = 1
+        signals[sell] = -1
+
+        return pd.Series(signals, index=data.index)
 
     def backtest(self, data: pd.DataFrame) -> Dict:
         """Backtest the strategy on historical data.
@@ -254,9 +326,9 @@ class SMAStrategy(BaseStrategy):
         Returns:
             dict: Backtest results including performance metrics
         """
-        signals = self.generate_signals(data)
         short_sma = self.calculate_sma(data, self.short_period)
         long_sma = self.calculate_sma(data, self.long_period)
+        signals = self._signals_from_smas(data, short_sma, long_sma)
 
         # Calculate metrics
         metrics = self.calculate_metrics(data, signals)
@@ -265,9 +337,17 @@ class SMAStrategy(BaseStrategy):
         trend_strength = (short_sma - long_sma) / long_sma
 
         # Calculate additional metrics
-        price_above_short = (data["close"] > short_sma).rolling(window=20).mean()
-        price_above_long = (data["close"] > long_sma).rolling(window=20).mean()
-        trend_consistency = price_above_short.corr(price_above_long)
+        price = data["close"].to_numpy(dtype=np.float64)
+        price_above_short = rolling_sum(price > short_sma.to_numpy(), 20) / 20
+        price_above_long = rolling_sum(price > long_sma.to_numpy(), 20) / 20
+        valid = ~np.isnan(price_above_short)  # Shared 20-bar warm-up
+        trend_consistency = np.corrcoef(
+            price_above_short[valid], price_above_long[valid]
+        )[0, 1]
+
+        # Count entries into and exits from the market; signals hold no NaN,
+        # so the first bar simply contributes no change
+        position_changes = np.abs(np.diff(np.abs(signals.to_numpy()))).sum()
 
         # Add strategy-specific metrics
         metrics.update(
@@ -277,11 +357,9 @@ class SMAStrategy(BaseStrategy):
                 "long_sma": long_sma,
                 "strategy_metrics": {
                     "mean_sma_spread": float((short_sma - long_sma).mean()),
-                    "sma_crossovers": int(
-                        abs(signals).diff().fillna(0).abs().sum() / 2
-                    ),
+                    "sma_crossovers": int(position_changes / 2),
                     "avg_trend_duration": float(
-                        1 / (abs(signals).diff().fillna(0).abs().mean() / 2)
+                        1 / (position_changes / len(signals) / 2)
                     ),
                     "price_above_long_sma": float(
                         (data["close"] > long_sma).mean() * 100
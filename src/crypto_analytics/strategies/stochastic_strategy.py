@@ -2,8 +2,53 @@
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, Optional, Tuple, Union
 from .base_strategy import BaseStrategy
+from ..utils.rolling import compare_prev, pct_change, rolling_nanmean
+
+
+@lru_cache(maxsize=None)
+def _exp_weight_table(period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalized exponential weights for every window length up to period.
+
+    Row length - 1 holds the weights of a window of that many bars, left
+    aligned and zero padded. The table and row sums are cached per period
+    and returned read-only.
+    """
+    table = np.zeros((period, period))
+    for length in range(1, period + 1):
+        weights = np.exp(np.linspace(-1, 0, length))
+        table[length - 1, :length] = weights / weights.sum()
+    totals = table.sum(axis=1)
+
+    table.setflags(write=False)
+    totals.setflags(write=False)
+    return table, totals
+
+
+def _exp_weighted_windows(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponentially weighted mean over each trailing window of period bars.
+
+    Weights rise from exp(-1) to 1 towards the latest bar. Bars before the
+    first full window average everything so far, with the weights spread
+    over the shorter window.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    result = np.empty(len(values))
+    table, totals = _exp_weight_table(period)
+
+    for length in range(1, min(period, len(values) + 1)):
+        result[length - 1] = (
+            values[:length] @ table[length - 1, :length] / totals[length - 1]
+        )
+
+    if len(values) >= period:
+        windows = sliding_window_view(values, period)
+        result[period - 1 :] = windows @ table[-1] / totals[-1]
+
+    return result
 
 
 class StochasticStrategy(BaseStrategy):
@@ -53,51 +98,22 @@ class StochasticStrategy(BaseStrategy):
         d_period = d_period or self.d_period
 
         # Calculate %K with minimum periods and weighted windows
-        k = pd.Series(index=data.index, dtype=float)
-
-        for i in range(len(data)):
-            if i < k_period:
-                window = slice(0, i + 1)
-            else:
-                window = slice(i - k_period + 1, i + 1)
-
-            window_data = data.iloc[window]
-            window_high = window_data["high"]
-            window_low = window_data["low"]
-
-            # Use exponential weights for recent prices
-            weights = np.exp(np.linspace(-1, 0, len(window_data)))
-            weights = weights / weights.sum()
-
-            # Calculate weighted high and low
-            high = np.average(window_high, weights=weights)
-            low = np.average(window_low, weights=weights)
-
-            if high == low:
-                k.iloc[i] = 50  # Middle value when range is zero
-            else:
-                # Calculate %K with current close and clip to 0-100 range
-                k.iloc[i] = np.clip(
-                    100 * (data["close"].iloc[i] - low) / (high - low), 0, 100
-                )
-
-        # Calculate %D with weighted moving average
-        d = pd.Series(index=data.index, dtype=float)
-
-        for i in range(len(data)):
-            if i < d_period:
-                window = slice(0, i + 1)
-            else:
-                window = slice(i - d_period + 1, i + 1)
-
-            window_k = k.iloc[window]
-
-            # Use exponential weights for smoothing
-            weights = np.exp(np.linspace(-1, 0, len(window_k)))
-            weights = weights / weights.sum()
-
-            # Calculate weighted average and clip to 0-100 range
-            d.iloc[i] = np.clip(np.average(window_k, weights=weights), 0, 100)
+        high = _exp_weighted_windows(data["high"].to_numpy(), k_period)
+        low = _exp_weighted_windows(data["low"].to_numpy(), k_period)
+        close = data["close"].to_numpy(dtype=np.float64)
+
+        # Middle value when range is zero, otherwise %K with current close
+        # clipped to 0-100 range
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k_values = np.clip(100 * (close - low) / (high - low), 0, 100)
+        k_values[high == low] = 50
+        k = pd.Series(k_values, index=data.index)
+
+        # Calculate %D with weighted moving average, clipped to 0-100 range
+        d = pd.Series(
+            np.clip(_exp_weighted_windows(k_values, d_period), 0, 100),
+            index=data.index,
+        )
 
         return k, d
 
@@ -111,17 +127,40 @@ class StochasticStrategy(BaseStrategy):
             pd.Series: Series of trading signals (1 for buy, -1 for sell, 0 for hold)
         """
         k, d = self.calculate_stochastic(data)
-        signals = pd.Series(0, index=data.index)
+        return self._signals_from_stochastic(data, k, d)
+
+    def _signals_from_stochastic(
+        self, data: pd.DataFrame, k: pd.Series, d: pd.Series
+    ) -> pd.Series:
+        """Generate trading signals from precomputed %K and %D lines.
+
+        Args:
+            data: DataFrame with OHLC data
+            k: %K line
+            d: %D line
+
+        Returns:
+            pd.Series: Series of trading signals (1 for buy, -1 for sell, 0 for hold)
+        """
+        k = k.to_numpy(dtype=np.float64)
+        d = d.to_numpy(dtype=np.float64)
+        k_prev = np.empty_like(k)
+        k_prev[:1] = np.nan
+        k_prev[1:] = k[:-1]
+        k_rising = compare_prev(k, np.greater)
+        k_falling = compare_prev(k, np.less)
 
         # Calculate trend and momentum
-        price = data["close"]
-        price_sma = price.rolling(window=20, min_periods=1).mean()
-        momentum = price.pct_change(3)
-        momentum_ma = momentum.rolling(window=3, min_periods=1).mean()
+        price = data["close"].to_numpy(dtype=np.float64)
+        price_sma = rolling_nanmean(price, 20)
+        momentum = pct_change(price, 3)
+        momentum_ma = rolling_nanmean(momentum, 3)
 
         # Calculate trend direction
         trend_up = price > price_sma
         momentum_up = momentum_ma > 0
+        momentum_positive = momentum > 0
+        momentum_negative = momentum < 0
 
         # Generate signals with more sensitive conditions
         oversold = (k < self.oversold) | (d < self.oversold)
@@ -134,18 +173,19 @@ class StochasticStrategy(BaseStrategy):
         sell_signals = overbought & (~momentum_up | ~trend_up)
 
         # Add early reversal signals
-        early_buy = (k.shift(1) < self.oversold) & (k > k.shift(1)) & (momentum > 0)
-        early_sell = (k.shift(1) > self.overbought) & (k < k.shift(1)) & (momentum < 0)
+        early_buy = (k_prev < self.oversold) & k_rising & momentum_positive
+        early_sell = (k_prev > self.overbought) & k_falling & momentum_negative
 
         # Add momentum confirmation signals
-        momentum_buy = (k < 30) & (k > k.shift(1)) & (momentum > 0)
-        momentum_sell = (k > 70) & (k < k.shift(1)) & (momentum < 0)
+        momentum_buy = (k < 30) & k_rising & momentum_positive
+        momentum_sell = (k > 70) & k_falling & momentum_negative
 
-        # Combine signals
+        # Combine signals, sell conditions overriding buys
+        signals = np.zeros(len(price), dtype=np.int8)
         signals[buy_signals | early_buy | momentum_buy] = 1
         signals[sell_signals | early_sell | momentum_sell] = -1
 
-        return signals
+        return pd.Series(signals, index=data.index)
 
     def backtest(self, data: pd.DataFrame) -> Dict:
         """Backtest the strategy on historical data.
@@ -156,8 +196,8 @@ class StochasticStrategy(BaseStrategy):
         Returns:
             dict: Backtest results including performance metrics
         """
-        signals = self.generate_signals(data)
         k, d = self.calculate_stochastic(data)
+        signals = self._signals_from_stochastic(data, k, d)
 
         # Calculate metrics
         metrics = self.calculate_metrics(data, signals)
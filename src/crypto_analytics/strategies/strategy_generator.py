@@ -2,10 +2,13 @@
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+import os
 import random
 from ..indicators import MACD, BollingerBands
+from ..utils.rolling import pct_change
 from .base_strategy import BaseStrategy
 
 
@@ -22,6 +25,74 @@ class StrategyParams:
     lookback_period: int
 
 
+def _sample_std(values: np.ndarray) -> float:
+    """Standard deviation with ddof=1, NaN for fewer than two values."""
+    return values.std(ddof=1) if len(values) > 1 else np.nan
+
+
+def _entry_signals(
+    trend: np.ndarray,
+    oversold: Union[float, np.ndarray],
+    overbought: Union[float, np.ndarray],
+) -> np.ndarray:
+    """Buy below the oversold threshold, else sell above the overbought one."""
+    return np.where(trend < oversold, 1.0, np.where(trend > overbought, -1.0, 0.0))
+
+
+def _run_adaptive(
+    price: np.ndarray,
+    entries: np.ndarray,
+    position_size: float,
+    stop_loss: float,
+    take_profit: float,
+    lookback: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Accumulate entry signals into clipped positions with stop exits.
+
+    Each bar from lookback on adds its entry signal to the previous position,
+    clipped to +/- position_size. A held position whose move from the last
+    close reaches the stop-loss or take-profit is closed instead. Every bar
+    depends on the previous position, so the walk runs as a loop over Python
+    floats; the moves are computed up front with NumPy.
+
+    Args:
+        price: 1-D array of prices
+        entries: 1-D array of entry signals (1 buy, -1 sell, 0 none)
+        position_size: Largest absolute position
+        stop_loss: Loss fraction that closes a position
+        take_profit: Gain fraction that closes a position
+        lookback: First bar that may trade
+
+    Returns:
+        tuple: (signal, position) float64 arrays
+    """
+    n = len(price)
+    move = np.full(n, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        move[1:] = (price[1:] - price[:-1]) / price[:-1]
+
+    signal = [0.0] * n
+    position = [0.0] * n
+    entries = entries.tolist()
+    move = move.tolist()
+    prev_position = 0.0
+
+    for i in range(lookback, n):
+        signal[i] = entries[i]
+        current = min(max(prev_position + entries[i], -position_size), position_size)
+
+        if prev_position != 0:
+            held_move = move[i] * prev_position
+            if held_move <= -stop_loss or held_move >= take_profit:
+                signal[i] = -prev_position
+                current = 0.0
+
+        position[i] = current
+        prev_position = current
+
+    return np.array(signal), np.array(position)
+
+
 class StrategyEvaluator:
     """Evaluates strategy performance using multiple metrics."""
 
@@ -36,29 +107,37 @@ class StrategyEvaluator:
         }
 
     def calculate_metrics(self, signals: pd.DataFrame) -> Dict[str, float]:
-        returns = signals["strategy_returns"].dropna()
+        return self._metrics_from_returns(
+            signals["strategy_returns"].to_numpy(dtype=np.float64)
+        )
+
+    def _metrics_from_returns(self, returns: np.ndarray) -> Dict[str, float]:
+        """Calculate metrics from a strategy returns array, skipping NaN."""
+        returns = returns[~np.isnan(returns)]
         if len(returns) == 0:
             return {metric: 0.0 for metric in self.metrics_weights}
 
-        sharpe = (
-            returns.mean() / returns.std() * np.sqrt(252) if returns.std() != 0 else 0
-        )
-        downside_returns = returns[returns < 0]
+        mean_return = returns.mean()
+        returns_std = _sample_std(returns)
+        sharpe = mean_return / returns_std * np.sqrt(252) if returns_std != 0 else 0
+
+        losing = returns < 0
+        downside_std = _sample_std(returns[losing])
         sortino = (
-            returns.mean() * np.sqrt(252) / downside_returns.std()
-            if len(downside_returns) > 0 and downside_returns.std() != 0
+            mean_return * np.sqrt(252) / downside_std
+            if losing.any() and downside_std != 0
             else 0
         )
 
-        cum_returns = (1 + returns).cumprod()
-        rolling_max = cum_returns.expanding().max()
-        drawdowns = (cum_returns - rolling_max) / rolling_max
-        max_drawdown = drawdowns.min()
+        cum_returns = np.cumprod(1 + returns)
+        rolling_max = np.maximum.accumulate(cum_returns)
+        max_drawdown = ((cum_returns - rolling_max) / rolling_max).min()
 
-        win_rate = (returns > 0).mean()
+        winning = returns > 0
+        win_rate = winning.mean()
         profit_factor = (
-            abs(returns[returns > 0].sum()) / abs(returns[returns < 0].sum())
-            if len(returns[returns < 0]) > 0
+            abs(returns[winning].sum()) / abs(returns[losing].sum())
+            if losing.any()
             else float("inf")
         )
         profit_factor = min(profit_factor, 1000.0)
@@ -189,20 +268,99 @@ class StrategyGenerator:
         population_size: int = 50,
         generations: int = 20,
         mutation_rate: float = 0.2,
+        max_workers: Optional[int] = 1,
     ) -> Tuple[StrategyParams, Dict[str, float]]:
+        """Evolve strategy parameters on the training data.
+
+        Individuals are independent within a generation, so with max_workers
+        above 1 their fitness is evaluated in worker processes that each
+        receive the training data once. Selection, crossover and mutation
+        stay in this process.
+
+        Args:
+            population_size: Number of parameter sets per generation
+            generations: Number of generations to evolve
+            mutation_rate: Probability of mutating each parameter group
+            max_workers: Maximum number of worker processes; 1 (the default)
+                evaluates serially in the current process and None uses one
+                worker per CPU
+
+        Returns:
+            tuple: (best parameters, test metrics), or random parameters and
+            an empty dict when the best set does not hold up on test data
+        """
         population = [self.generate_random_params() for _ in range(population_size)]
+
+        # Indicator settings are the same for every individual, so the
+        # training indicators are calculated once and shared
+        indicators = (
+            AdaptiveStrategy(population[0])._compute_indicators(self.train_data)
+            if population
+            else None
+        )
+
+        if max_workers == 1:
+            best_params = self._evolve(
+                population,
+                generations,
+                mutation_rate,
+                lambda population: _evaluate_population(
+                    population, self.train_data, self.train_evaluator, indicators
+                ),
+            )
+        else:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, population_size // (4 * workers))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.train_data, indicators),
+            ) as executor:
+                best_params = self._evolve(
+                    population,
+                    generations,
+                    mutation_rate,
+                    lambda population: [
+                        result
+                        for batch in executor.map(
+                            _evaluate_in_worker,
+                            [
+                                population[k : k + chunksize]
+                                for k in range(0, len(population), chunksize)
+                            ],
+                        )
+                        for result in batch
+                    ],
+                )
+
+        if best_params is not None:
+            strategy = AdaptiveStrategy(best_params)
+            test_signals = strategy.calculate_signals(self.test_data)
+            test_metrics = self.test_evaluator.calculate_metrics(test_signals)
+
+            if test_metrics["sharpe_ratio"] > 0 and test_metrics["max_drawdown"] > -0.5:
+                return best_params, test_metrics
+
+        return self.generate_random_params(), {}
+
+    def _evolve(
+        self,
+        population: List[StrategyParams],
+        generations: int,
+        mutation_rate: float,
+        evaluate,
+    ) -> Optional[StrategyParams]:
+        """Run the generation loop and return the fittest parameters seen."""
+        population_size = len(population)
         best_params = None
         best_fitness = -float("inf")
         best_metrics = None
 
         for generation in range(generations):
-            fitness_scores = []
-            for params in population:
-                strategy = AdaptiveStrategy(params)
-                signals = strategy.calculate_signals(self.train_data)
-                metrics = self.train_evaluator.calculate_metrics(signals)
-                fitness = self.train_evaluator.calculate_fitness(metrics)
-                fitness_scores.append((params, fitness, metrics))
+            fitness_scores = [
+                (params, fitness, metrics)
+                for params, (fitness, metrics) in zip(population, evaluate(population))
+            ]
 
             fitness_scores.sort(key=lambda x: x[1], reverse=True)
 
@@ -226,15 +384,89 @@ class StrategyGenerator:
 
             population = new_population
 
-        if best_params is not None:
-            strategy = AdaptiveStrategy(best_params)
-            test_signals = strategy.calculate_signals(self.test_data)
-            test_metrics = self.test_evaluator.calculate_metrics(test_signals)
+        return best_params
+
+
+# Training data held by each optimization worker process
+_worker_state: Optional[
+    Tuple[pd.DataFrame, StrategyEvaluator, Optional[Dict[str, pd.DataFrame]]]
+] = None
+
+
+def _init_worker(
+    train_data: pd.DataFrame, indicators: Optional[Dict[str, pd.DataFrame]]
+) -> None:
+    """Store the training data and its indicators once per worker process."""
+    global _worker_state
+    _worker_state = (train_data, StrategyEvaluator(train_data), indicators)
+
+
+def _evaluate_population(
+    population: List[StrategyParams],
+    data: pd.DataFrame,
+    evaluator: StrategyEvaluator,
+    indicators: Dict[str, pd.DataFrame],
+) -> List[Tuple[float, Dict[str, float]]]:
+    """Score several parameter sets on the same data.
+
+    The weighted indicator trend and entry signals of every parameter set are
+    computed together as one (parameter sets, bars) array, and each set is
+    scored straight from its strategy returns array. Only the
+    path-dependent position walk runs per parameter set. Scores match those
+    of each set's AdaptiveStrategy.calculate_signals output.
+
+    Args:
+        population: Parameter sets to score
+        data: DataFrame with a 'close' or 'Close' price column
+        evaluator: Evaluator providing metrics and fitness
+        indicators: Indicator outputs calculated from data
+
+    Returns:
+        list: (fitness, metrics) for each parameter set, in order
+    """
+    price = data["close"] if "close" in data.columns else data["Close"]
+    price = price.to_numpy(dtype=np.float64)
+    macd_line = indicators["MACD"]["macd_line"].to_numpy(dtype=np.float64)
+    bandwidth = indicators["BollingerBands"]["bandwidth"].to_numpy(dtype=np.float64)
+
+    def column(values):
+        return np.array(values, dtype=np.float64)[:, None]
+
+    trend = macd_line * column(
+        [params.indicator_weights["macd"] for params in population]
+    ) + bandwidth * column(
+        [params.indicator_weights["bollinger"] for params in population]
+    )
+    entries = _entry_signals(
+        trend,
+        column([params.entry_thresholds["oversold"] for params in population]),
+        column([params.entry_thresholds["overbought"] for params in population]),
+    )
+
+    returns = pct_change(price)
+    strategy_returns = np.full(len(price), np.nan)
+    results = []
+    for params, row in zip(population, entries):
+        _, position = _run_adaptive(
+            price,
+            row,
+            params.position_size,
+            params.stop_loss,
+            params.take_profit,
+            params.lookback_period,
+        )
+        np.multiply(position[:-1], returns[1:], out=strategy_returns[1:])
+        metrics = evaluator._metrics_from_returns(strategy_returns)
+        results.append((evaluator.calculate_fitness(metrics), metrics))
 
-            if test_metrics["sharpe_ratio"] > 0 and test_metrics["max_drawdown"] > -0.5:
-                return best_params, test_metrics
+    return results
 
-        return self.generate_random_params(), {}
+
+def _evaluate_in_worker(
+    population: List[StrategyParams],
+) -> List[Tuple[float, Dict[str, float]]]:
+    """Score a batch of parameter sets on the training data of this worker."""
+    return _evaluate_population(population, *_worker_state)
 
 
 class AdaptiveStrategy(BaseStrategy):
@@ -249,58 +481,76 @@ class AdaptiveStrategy(BaseStrategy):
         )
         self.params = params
 
-    def calculate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        signals = data.copy()
-        signals["signal"] = pd.Series(0.0, index=signals.index, dtype="float64")
-        signals["position"] = pd.Series(0.0, index=signals.index, dtype="float64")
-
-        if "close" in signals.columns:
-            signals["price"] = signals["close"]
-        elif "Close" in signals.columns:
-            signals["price"] = signals["Close"]
-            signals["close"] = signals["Close"]
-
-        macd_data = self.indicators[0].calculate(signals)
-        bb_data = self.indicators[1].calculate(signals)
-
-        for i in range(self.params.lookback_period, len(signals)):
-            macd_trend = (
-                macd_data["macd_line"].iloc[i] * self.params.indicator_weights["macd"]
-                + bb_data["bandwidth"].iloc[i]
-                * self.params.indicator_weights["bollinger"]
-            )
+    def _compute_indicators(self, data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Calculate every indicator once for reuse across parameter sets.
 
-            if macd_trend < self.params.entry_thresholds["oversold"]:
-                signals.iloc[i, signals.columns.get_loc("signal")] = 1
-            elif macd_trend > self.params.entry_thresholds["overbought"]:
-                signals.iloc[i, signals.columns.get_loc("signal")] = -1
+        Args:
+            data: DataFrame with a 'close' or 'Close' price column
 
-            new_position = signals.iloc[i - 1]["position"] + signals.iloc[i]["signal"]
-            signals.iloc[i, signals.columns.get_loc("position")] = np.clip(
-                new_position, -self.params.position_size, self.params.position_size
-            )
+        Returns:
+            Dict mapping indicator class names to their output
+        """
+        if "close" not in data.columns and "Close" in data.columns:
+            data = data.assign(close=data["Close"])
 
-            if signals.iloc[i - 1]["position"] != 0:
-                returns = (
-                    signals.iloc[i]["price"] - signals.iloc[i - 1]["price"]
-                ) / signals.iloc[i - 1]["price"]
-                if returns * signals.iloc[i - 1]["position"] <= -self.params.stop_loss:
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-                elif (
-                    returns * signals.iloc[i - 1]["position"] >= self.params.take_profit
-                ):
-                    signals.iloc[i, signals.columns.get_loc("signal")] = -signals.iloc[
-                        i - 1
-                    ]["position"]
-                    signals.iloc[i, signals.columns.get_loc("position")] = 0
-
-        signals["returns"] = signals["price"].pct_change()
-        signals["strategy_returns"] = signals["position"].shift(1) * signals["returns"]
+        return {
+            indicator.__class__.__name__: indicator.calculate(data)
+            for indicator in self.indicators
+        }
 
-        return signals
+    def calculate_signals(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> pd.DataFrame:
+        """Calculate trading signals from the weighted indicator trend.
+
+        Args:
+            data: DataFrame with a 'close' or 'Close' price column
+            indicators: Optional indicator outputs already calculated from data
+
+        Returns:
+            DataFrame with signals, positions and strategy returns
+        """
+        price_column = "close" if "close" in data.columns else "Close"
+        price = data[price_column].to_numpy(dtype=np.float64)
+
+        if indicators is None:
+            indicators = self._compute_indicators(data)
+        macd_data = indicators["MACD"]
+        bb_data = indicators["BollingerBands"]
+
+        # Entry signals from the weighted indicator trend
+        weights = self.params.indicator_weights
+        macd_trend = (
+            macd_data["macd_line"].to_numpy(dtype=np.float64) * weights["macd"]
+            + bb_data["bandwidth"].to_numpy(dtype=np.float64) * weights["bollinger"]
+        )
+        entries = _entry_signals(
+            macd_trend,
+            self.params.entry_thresholds["oversold"],
+            self.params.entry_thresholds["overbought"],
+        )
+
+        signal, position = _run_adaptive(
+            price,
+            entries,
+            self.params.position_size,
+            self.params.stop_loss,
+            self.params.take_profit,
+            self.params.lookback_period,
+        )
+        returns = pct_change(price)
+        strategy_returns = np.full(len(price), np.nan)
+        np.multiply(position[:-1], returns[1:], out=strategy_returns[1:])
+
+        # assign shares the input columns instead of copying them
+        columns = {"signal": signal, "position": position, "price": price}
+        if price_column == "Close":
+            columns["close"] = price
+        columns["returns"] = returns
+        columns["strategy_returns"] = strategy_returns
+        return data.assign(**columns)
 
     def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Generate trading signals based on indicator rules."""
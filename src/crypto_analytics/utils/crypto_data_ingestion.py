@@ -1,4 +1,5 @@
 import requests
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import time
@@ -30,6 +31,10 @@ class CryptoDataIngestion:
         self.output_dir = Path("data")
         self.output_dir.mkdir(exist_ok=True)
 
+        # Reuse one connection pool so repeated requests skip the TCP/TLS
+        # handshake
+        self.session = requests.Session()
+
         # Load MEXC API credentials from environment variables
         self.mexc_api_key = os.getenv("mexc_id")
         self.mexc_api_secret = os.getenv("mexc_secret")
@@ -37,17 +42,23 @@ class CryptoDataIngestion:
         if not self.mexc_api_key or not self.mexc_api_secret:
             logging.warning("MEXC API credentials not found in environment variables")
 
+        # Keyed HMAC state, built once and copied for each signature
+        self._mexc_hmac = None
+
     def _generate_mexc_signature(self, params: Dict[str, Any]) -> str:
         """Generate signature for MEXC API authentication"""
         if not self.mexc_api_secret:
             raise ValueError("MEXC API secret is required for authenticated endpoints")
 
+        if self._mexc_hmac is None:
+            self._mexc_hmac = hmac.new(
+                self.mexc_api_secret.encode("utf-8"), digestmod=hashlib.sha256
+            )
+
         query_string = urlencode(params)
-        return hmac.new(
-            self.mexc_api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        mac = self._mexc_hmac.copy()
+        mac.update(query_string.encode("utf-8"))
+        return mac.hexdigest()
 
     def _make_mexc_request(
         self,
@@ -75,9 +86,9 @@ class CryptoDataIngestion:
         for attempt in range(max_retries):
             try:
                 if method == "GET":
-                    response = requests.get(url, params=params, headers=headers)
+                    response = self.session.get(url, params=params, headers=headers)
                 elif method == "POST":
-                    response = requests.post(url, json=params, headers=headers)
+                    response = self.session.post(url, json=params, headers=headers)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -125,36 +136,29 @@ class CryptoDataIngestion:
             response = self._make_mexc_request(endpoint, params=params)
 
             if response:
-                # Convert response to DataFrame with correct MEXC API columns
+                # Each kline row holds open time, open, high, low, close,
+                # volume, close time and quote asset volume; prices and
+                # volumes arrive as strings and are parsed in one pass
+                raw = np.asarray(response, dtype=object)
+                ohlcv = raw[:, 1:6].astype(np.float64)
+
                 df = pd.DataFrame(
-                    response,
-                    columns=[
-                        "timestamp",  # Open time
-                        "open",  # Open price
-                        "high",  # High price
-                        "low",  # Low price
-                        "close",  # Close price
-                        "volume",  # Volume
-                        "close_time",  # Close time
-                        "quote_volume",  # Quote asset volume
-                    ],
+                    {
+                        "timestamp": pd.to_datetime(
+                            raw[:, 0].astype(np.int64), unit="ms"
+                        ),
+                        "open": ohlcv[:, 0],
+                        "high": ohlcv[:, 1],
+                        "low": ohlcv[:, 2],
+                        "close": ohlcv[:, 3],
+                        "volume": ohlcv[:, 4],
+                        "close_time": pd.to_datetime(
+                            raw[:, 6].astype(np.int64), unit="ms"
+                        ),
+                        "quote_volume": raw[:, 7].astype(np.float64),
+                    }
                 )
 
-                # Convert timestamp to datetime
-                df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-                df["close_time"] = pd.to_datetime(df["close_time"], unit="ms")
-
-                # Convert numeric columns
-                numeric_columns = [
-                    "open",
-                    "high",
-                    "low",
-                    "close",
-                    "volume",
-                    "quote_volume",
-                ]
-                df[numeric_columns] = df[numeric_columns].astype(float)
-
                 return df
 
             return None
@@ -177,3 +181,18 @@ class CryptoDataIngestion:
         else:
             logging.error("Data must be a pandas DataFrame")
             return False
+
+    def save_to_parquet(self, data, filename):
+        """Save data to a zstd-compressed Parquet file"""
+        if isinstance(data, pd.DataFrame):
+            try:
+                filepath = self.output_dir / f"{filename}.parquet"
+                data.to_parquet(filepath, index=False, compression="zstd")
+                logging.info(f"Data saved successfully to {filepath}")
+                return True
+            except Exception as e:
+                logging.error(f"Error saving data to Parquet: {str(e)}")
+                return False
+        else:
+            logging.error("Data must be a pandas DataFrame")
+            return False
@@ -2,21 +2,70 @@
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Union, Dict
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Union, Dict
+from .rolling import pct_change
+
+try:
+    import pyarrow  # noqa: F401
+
+    # Arrow's reader parses columns in parallel; values still land in
+    # NumPy-backed columns for the array code paths
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
 
 
 class DataManager:
     """Manages data operations for cryptocurrency analysis."""
 
+    _CACHE_SIZE = 8
+
     def __init__(self):
         """Initialize DataManager."""
         self.data = None
+        self._cache = OrderedDict()
+        self._cache_source = None
+
+    def _cached(
+        self, key: Hashable, build: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return a derived frame, building it only once per loaded dataset.
+
+        Entries belong to the DataFrame currently in self.data and are dropped
+        as soon as a different frame is loaded or assigned. Changes made in
+        place to self.data are not detected.
+
+        Args:
+            key: Cache key for the derived frame
+            build: Function that builds the frame on a cache miss
+
+        Returns:
+            pd.DataFrame: A copy of the cached frame
+        """
+        if self._cache_source is not self.data:
+            self._cache.clear()
+            self._cache_source = self.data
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            self._cache[key] = build()
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
 
-    def load_data(self, data: Union[pd.DataFrame, str]) -> pd.DataFrame:
+        # Copy-on-write makes this copy lazy while keeping the entry private
+        return self._cache[key].copy()
+
+    def load_data(
+        self, data: Union[pd.DataFrame, str], columns: Optional[list] = None
+    ) -> pd.DataFrame:
         """Load data from a DataFrame or file path.
 
         Args:
             data: DataFrame or path to data file
+            columns: Optional columns to read from a Parquet file; other
+                columns are never read from disk
 
         Returns:
             pd.DataFrame: Loaded data
@@ -27,9 +76,11 @@ class DataManager:
             # Attempt to load from file
             try:
                 if data.endswith(".csv"):
-                    self.data = pd.read_csv(data, parse_dates=True, index_col=0)
+                    self.data = pd.read_csv(
+                        data, engine=_CSV_ENGINE, parse_dates=True, index_col=0
+                    )
                 elif data.endswith(".parquet"):
-                    self.data = pd.read_parquet(data)
+                    self.data = pd.read_parquet(data, columns=columns)
                 else:
                     raise ValueError("Unsupported file format")
             except Exception as e:
@@ -77,10 +128,9 @@ class DataManager:
         if missing_columns:
             raise ValueError(f"Missing columns: {missing_columns}")
 
-        prepared_data = self.data[columns].copy()
-        prepared_data = prepared_data.dropna()
-
-        return prepared_data
+        return self._cached(
+            ("prepare", tuple(columns)), lambda: self.data[columns].dropna()
+        )
 
     def get_returns(self, period: int = 1) -> pd.Series:
         """Calculate returns for the specified period.
@@ -94,8 +144,10 @@ class DataManager:
         if not self.validate_data():
             raise ValueError("Invalid data")
 
-        returns = self.data["close"].pct_change(period)
-        return returns.dropna()
+        close = self.data["close"]
+        returns = pct_change(close.to_numpy(dtype=np.float64), period)
+        valid = ~np.isnan(returns)
+        return pd.Series(returns[valid], index=close.index[valid], name=close.name)
 
     def get_volatility(self, window: int = 20) -> pd.Series:
         """Calculate rolling volatility.
@@ -110,6 +162,7 @@ class DataManager:
             raise ValueError("Invalid data")
 
         returns = self.get_returns()
+        # pandas' online rolling std is cheaper than rolling_mean_std here
         volatility = returns.rolling(window=window).std() * np.sqrt(252)  # Annualized
         return volatility.dropna()
 
@@ -125,18 +178,19 @@ class DataManager:
         if not self.validate_data():
             raise ValueError("Invalid data")
 
-        resampled = (
-            self.data.resample(rule)
-            .agg(
-                {
-                    "open": "first",
-                    "high": "max",
-                    "low": "min",
-                    "close": "last",
-                    "volume": "sum",
-                }
+        def aggregate() -> pd.DataFrame:
+            return (
+                self.data.resample(rule)
+                .agg(
+                    {
+                        "open": "first",
+                        "high": "max",
+                        "low": "min",
+                        "close": "last",
+                        "volume": "sum",
+                    }
+                )
+                .dropna()
             )
-            .dropna()
-        )
 
-        return resampled
+        return self._cached(("resample", rule), aggregate)
@@ -5,6 +5,20 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
 
 
+def _numeric_values(column: pd.Series) -> Optional[np.ndarray]:
+    """Return a numeric column as a NumPy array, in place when possible.
+
+    Nullable integer and float columns are converted to float64 with missing
+    values as NaN. Columns of any other dtype return None.
+    """
+    values = column.to_numpy()
+    if values.dtype.kind in "iuf":
+        return values
+    if column.dtype.kind in "iuf":
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    return None
+
+
 class DataValidator:
     """Validates data for cryptocurrency analysis."""
 
@@ -40,40 +54,50 @@ class DataValidator:
             messages.append(f"Missing required columns: {missing_columns}")
             return False, messages
 
+        # One NaN-propagating min per numeric column answers both the null and
+        # the sign check without allocating a mask
+        values = {}
+        minima = {}
+        null_columns = []
+        for col in self.required_columns:
+            column_values = _numeric_values(data[col])
+            if column_values is None:
+                if data[col].isnull().any():
+                    null_columns.append(col)
+                continue
+            values[col] = column_values
+            minima[col] = column_values.min()
+            if np.isnan(minima[col]):
+                null_columns.append(col)
+
         # Check for null values
-        null_columns = (
-            data[self.required_columns]
-            .columns[data[self.required_columns].isnull().any()]
-            .tolist()
-        )
         if null_columns:
             messages.append(f"Null values found in columns: {null_columns}")
             return False, messages
 
         # Check for negative values in volume if present
-        if "volume" in self.required_columns and "volume" in data.columns:
-            if (data["volume"] < 0).any():
-                messages.append("Negative values found in volume column")
-                return False, messages
+        if "volume" in minima and minima["volume"] < 0:
+            messages.append("Negative values found in volume column")
+            return False, messages
 
         # Check for negative prices
-        price_columns = [
-            col
-            for col in ["close", "high", "low", "open"]
-            if col in self.required_columns
-        ]
-        for col in price_columns:
-            if (data[col] < 0).any():
+        for col in ["close", "high", "low", "open"]:
+            if col in minima and minima[col] < 0:
                 messages.append(f"Negative values found in {col} column")
                 return False, messages
 
         # Check price relationships if OHLC data is present
         if all(col in data.columns for col in ["high", "low", "close"]):
-            invalid_prices = (
-                (data["high"] < data["low"])
-                | (data["close"] > data["high"])
-                | (data["close"] < data["low"])
-            )
+            prices = [
+                values[col] if col in values else _numeric_values(data[col])
+                for col in ["high", "low", "close"]
+            ]
+            if any(price is None for price in prices):
+                prices = [data[col] for col in ["high", "low", "close"]]
+            high, low, close = prices
+            invalid_prices = high < low
+            invalid_prices |= close > high
+            invalid_prices |= close < low
             if invalid_prices.any():
                 messages.append("Invalid price relationships found")
                 return False, messages
@@ -0,0 +1,49 @@
+"""Stop-loss and take-profit exit helpers operating on raw NumPy arrays."""
+
+import numpy as np
+from typing import Tuple
+
+
+def level_exits(
+    close: np.ndarray, position: np.ndarray, stop_loss: float, take_profit: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the bars where a held position hits its stop-loss or take-profit.
+
+    Each bar checks the move from the previous close against the previous
+    bar's position. An exit flattens the position on its own bar, so the bar
+    after an exit has nothing to check; within a run of consecutive bars that
+    breach a level, exits therefore land on every other bar starting with the
+    first. This gives the same result as walking the bars one by one.
+
+    Args:
+        close: 1-D array of close prices
+        position: 1-D array of positions before any exits
+        stop_loss: Loss fraction that closes a position
+        take_profit: Gain fraction that closes a position
+
+    Returns:
+        tuple: (stop_exits, take_exits) boolean arrays; a stop wins when a bar
+        breaches both levels
+    """
+    close = np.asarray(close, dtype=np.float64)
+    position = np.asarray(position, dtype=np.float64)
+    n = len(close)
+
+    move = np.zeros(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        move[1:] = (close[1:] - close[:-1]) / close[:-1] * position[:-1]
+
+    held = np.zeros(n, dtype=bool)
+    held[1:] = position[:-1] != 0
+    stop_hit = held & (move <= -stop_loss)
+    take_hit = held & ~stop_hit & (move >= take_profit)
+    breach = stop_hit | take_hit
+
+    # Offset of each bar within its run of breaching bars
+    bars = np.arange(n)
+    run_start = np.zeros(n, dtype=bars.dtype)
+    run_start[1:] = np.where(breach[1:] & ~breach[:-1], bars[1:], 0)
+    np.maximum.accumulate(run_start, out=run_start)
+    exits = breach & ((bars - run_start) % 2 == 0)
+
+    return exits & stop_hit, exits & take_hit
@@ -3,6 +3,42 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
+from .rolling import rolling_max, rolling_min, true_range
+
+
+def _confirmed_levels(
+    levels: np.ndarray, num_points: int, before: np.ufunc, after: np.ufunc
+) -> np.ndarray:
+    """Keep the levels that hold against their neighbouring bars.
+
+    A level at bar i is kept when before(levels[i - k], levels[i]) and
+    after(levels[i + k], levels[i]) are true for every k from 1 to
+    num_points. Comparisons run over whole offset slices, and any NaN
+    neighbour rejects the level.
+
+    Args:
+        levels: 1-D array of candidate levels
+        num_points: Number of bars checked on each side
+        before: Comparison ufunc for the preceding bars
+        after: Comparison ufunc for the following bars
+
+    Returns:
+        np.ndarray: Confirmed levels, NaN elsewhere
+    """
+    n = len(levels)
+    result = np.full(n, np.nan)
+    m = n - 2 * num_points
+    if m <= 0:
+        return result
+
+    center = levels[num_points : n - num_points]
+    confirmed = np.ones(m, dtype=bool)
+    for k in range(1, num_points + 1):
+        confirmed &= before(levels[num_points - k : n - num_points - k], center)
+        confirmed &= after(levels[num_points + k : n - num_points + k], center)
+
+    result[num_points : n - num_points][confirmed] = center[confirmed]
+    return result
 
 
 class MarketAnalyzer:
@@ -295,26 +331,20 @@ class MarketAnalyzer:
             raise ValueError("Data must contain 'high' and 'low' columns")
 
         # Calculate rolling min/max
-        rolling_low = data["low"].rolling(window=window).min()
-        rolling_high = data["high"].rolling(window=window).max()
+        rolling_low = rolling_min(data["low"].to_numpy(), window)
+        rolling_high = rolling_max(data["high"].to_numpy(), window)
 
         # Identify support levels (local minima)
-        support = pd.Series(np.nan, index=data.index)
-        for i in range(num_points, len(data) - num_points):
-            if all(rolling_low.iloc[i - num_points : i] >= rolling_low.iloc[i]) and all(
-                rolling_low.iloc[i + 1 : i + num_points + 1] > rolling_low.iloc[i]
-            ):
-                support.iloc[i] = rolling_low.iloc[i]
+        support = pd.Series(
+            _confirmed_levels(rolling_low, num_points, np.greater_equal, np.greater),
+            index=data.index,
+        )
 
         # Identify resistance levels (local maxima)
-        resistance = pd.Series(np.nan, index=data.index)
-        for i in range(num_points, len(data) - num_points):
-            if all(
-                rolling_high.iloc[i - num_points : i] <= rolling_high.iloc[i]
-            ) and all(
-                rolling_high.iloc[i + 1 : i + num_points + 1] < rolling_high.iloc[i]
-            ):
-                resistance.iloc[i] = rolling_high.iloc[i]
+        resistance = pd.Series(
+            _confirmed_levels(rolling_high, num_points, np.less_equal, np.less),
+            index=data.index,
+        )
 
         return support, resistance
 
@@ -334,12 +364,15 @@ class MarketAnalyzer:
             raise ValueError("Data must contain 'high', 'low', and 'close' columns")
 
         # Calculate true range
-        high_low = data["high"] - data["low"]
-        high_close = abs(data["high"] - data["close"].shift(1))
-        low_close = abs(data["low"] - data["close"].shift(1))
-
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=window, min_periods=1).mean()
+        tr = pd.Series(
+            true_range(
+                data["high"].to_numpy(),
+                data["low"].to_numpy(),
+                data["close"].to_numpy(),
+            ),
+            index=data.index,
+        )
+        atr = tr.rolling(window=window, min_periods=1).mean()
 
         # Calculate directional movement
         high_diff = data["high"].diff()
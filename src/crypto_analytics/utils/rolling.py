@@ -0,0 +1,473 @@
+"""Rolling window helpers operating on raw NumPy arrays."""
+
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+
+def _as_float_array(values: np.ndarray) -> np.ndarray:
+    """Convert values to a float64 array.
+
+    Strided input, such as one column of a row-major OHLCV matrix, is copied
+    once into a contiguous buffer so the window passes below read memory with
+    unit stride.
+    """
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def pct_change(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Calculate fractional change over a number of bars.
+
+    Args:
+        values: 1-D array of values
+        periods: Number of bars to look back
+
+    Returns:
+        np.ndarray: values / values periods bars back - 1, NaN for the first
+        periods bars
+    """
+    x = np.asarray(values, dtype=np.float64)
+    change = np.full(len(x), np.nan)
+    if periods < len(x):
+        np.divide(x[periods:], x[:-periods], out=change[periods:])
+        change[periods:] -= 1
+    return change
+
+
+def diff(values: np.ndarray) -> np.ndarray:
+    """Calculate the difference from the previous bar.
+
+    Args:
+        values: 1-D array of values
+
+    Returns:
+        np.ndarray: Differences, NaN for the first bar
+    """
+    x = np.asarray(values, dtype=np.float64)
+    result = np.empty(len(x))
+    result[:1] = np.nan
+    np.subtract(x[1:], x[:-1], out=result[1:])
+    return result
+
+
+def compare_prev(values: np.ndarray, compare: np.ufunc) -> np.ndarray:
+    """Compare each value with the previous bar's.
+
+    Args:
+        values: 1-D array of values
+        compare: Comparison ufunc such as np.greater
+
+    Returns:
+        np.ndarray: Boolean results, False for the first bar
+    """
+    x = np.asarray(values)
+    result = np.zeros(len(x), dtype=bool)
+    compare(x[1:], x[:-1], out=result[1:])
+    return result
+
+
+def _block_pairs(values: np.ndarray, block: int) -> np.ndarray:
+    """Lay values out as rows of two consecutive blocks.
+
+    Row k holds block k - 1 followed by block k, with a zero block before the
+    first and zero padding after the last. A cumulative sum along a row then
+    gives every trailing window up to block long that ends in block k as the
+    difference of two entries, while only touching values from those two
+    blocks.
+    """
+    n = len(values)
+    num_blocks = -(-n // block)
+    padded = np.zeros((num_blocks + 1) * block)
+    padded[block : block + n] = values
+    blocks = padded.reshape(num_blocks + 1, block)
+    return np.concatenate([blocks[:-1], blocks[1:]], axis=1)
+
+
+def _window_sums(totals: np.ndarray, window: int, n: int) -> np.ndarray:
+    """Sum the trailing window at every position from row-wise cumsums."""
+    block = totals.shape[1] // 2
+    # Window ending at offset t of the later block is entries t - w + 1 .. t
+    sums = totals[:, block:] - totals[:, block - window : 2 * block - window]
+    return sums.ravel()[:n]
+
+
+def _trailing_sums(values: np.ndarray, window: int, block: int) -> np.ndarray:
+    """Sum the trailing window at every position from block-wise cumsums.
+
+    Each block is cumsummed on its own, so a window sum only touches values
+    from the block it ends in and the one before. Windows may be at most one
+    block long; a zero block before the first makes leading windows partial.
+    """
+    n = len(values)
+    num_blocks = -(-n // block)
+    padded = np.zeros((num_blocks + 1) * block)
+    padded[block : block + n] = values
+    totals = np.cumsum(padded.reshape(num_blocks + 1, block), axis=1)
+
+    sums = np.empty((num_blocks, block))
+    np.subtract(totals[1:, window:], totals[1:, :-window], out=sums[:, window:])
+    # Windows starting in the previous block take the rest of that block
+    np.subtract(totals[:-1, -1:], totals[:-1, block - window :], out=sums[:, :window])
+    sums[:, :window] += totals[1:, :window]
+    return sums.ravel()[:n]
+
+
+# Windows whose running sum of squares exceeds the squared deviation by more
+# than this factor lose too many digits to cancellation and are recomputed
+_CANCELLATION_LIMIT = 1e3
+
+# Windows up to this long are cheaper to sum offset by offset
+_SHORT_WINDOW = 8
+
+
+def _short_window_moments(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Window means and squared deviations, summing each window from scratch.
+
+    The variance uses the two-pass form sum((x - mean)**2). Results are
+    aligned with the last bar of each window and NaN for windows with NaN.
+    """
+    m = len(x) - window + 1
+    total = np.zeros(m)
+    for k in range(window):
+        total += x[k : k + m]
+    window_mean = total / window
+
+    squared = np.zeros(m)
+    for k in range(window):
+        deviation = x[k : k + m] - window_mean
+        squared += deviation * deviation
+
+    pad = np.full(window - 1, np.nan)
+    return np.concatenate([pad, window_mean]), np.concatenate([pad, squared])
+
+
+def _long_window_moments(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Window means and squared deviations from block pair cumulative sums.
+
+    Each row is centred on the mean of its later block, so a window never
+    sees values more than two blocks away. Windows whose running sum of
+    squares shows too much cancellation are recomputed with the two-pass
+    form. Results are aligned with the last bar of each window and NaN until
+    the first full window and for windows with NaN.
+    """
+    n = len(x)
+    missing = np.isnan(x)
+    full = np.zeros(n, dtype=bool)
+    if missing.any():
+        seen = np.cumsum(missing)
+        full[window - 1 :] = seen[window - 1 :] == np.append(0, seen[:-window])
+    else:
+        full[window - 1 :] = True
+
+    pairs = _block_pairs(x, window)
+    later = pairs[:, window:]
+    if missing.any():
+        present = np.maximum((~np.isnan(later)).sum(axis=1), 1)
+        centre = np.nansum(later, axis=1) / present
+        pairs -= centre[:, None]
+        pairs[np.isnan(pairs)] = 0.0
+    else:
+        centre = later.sum(axis=1) / window
+        pairs -= centre[:, None]
+
+    totals = np.cumsum(pairs, axis=1)
+    first = _window_sums(totals, window, n)
+    np.multiply(pairs, pairs, out=pairs)
+    np.cumsum(pairs, axis=1, out=totals)
+    squared = _window_sums(totals, window, n)
+    # The running sum of squares bounds the rounding error of both window sums
+    running = totals[:, window:].ravel()[:n]
+
+    window_mean = first / window
+    squared -= first * window_mean
+    window_mean += np.repeat(centre, window)[:n]
+
+    unstable = np.flatnonzero(full & (_CANCELLATION_LIMIT * squared < running))
+    for chunk in np.array_split(unstable, len(unstable) * window // (1 << 20) + 1):
+        windows = x[chunk[:, None] + np.arange(1 - window, 1)].astype(np.float64)
+        exact_mean = windows.mean(axis=1)
+        deviation = windows - exact_mean[:, None]
+        window_mean[chunk] = exact_mean
+        squared[chunk] = (deviation * deviation).sum(axis=1)
+
+    window_mean[~full] = np.nan
+    squared[~full] = np.nan
+    return window_mean, squared
+
+
+def rolling_mean_std(
+    values: np.ndarray, window: int, ddof: int = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate rolling mean and standard deviation.
+
+    Windows longer than a few bars take their sums of values and squares from
+    cumulative sums over pairs of adjacent window-length blocks, so the work
+    is O(n). Each pair is centred locally and never reaches more than two
+    blocks back, so results do not drift when the series spans several orders
+    of magnitude, and windows where the sum-of-squares form cancels badly are
+    recomputed with the two-pass form sum((x - mean)**2). Short windows use
+    the two-pass form directly.
+
+    Args:
+        values: 1-D array of values
+        window: Rolling window size
+        ddof: Delta degrees of freedom for the standard deviation
+
+    Returns:
+        tuple: (mean, std) arrays, NaN until the first full window and for
+        any window containing NaN
+    """
+    if window < 1:
+        raise ValueError("Window must be a positive integer")
+
+    x = _as_float_array(values)
+    n = len(x)
+    if n < window:
+        return np.full(n, np.nan), np.full(n, np.nan)
+
+    if window <= _SHORT_WINDOW:
+        mean, squared = _short_window_moments(x, window)
+    else:
+        mean, squared = _long_window_moments(x, window)
+
+    std = np.full(n, np.nan)
+    if window > ddof:
+        np.maximum(squared, 0.0, out=squared)
+        np.sqrt(squared / (window - ddof), out=std)
+
+    return mean, std
+
+
+# Windows up to these lengths are reduced fastest by folding over the offsets
+_FOLD_SUM_WINDOW = 16
+_FOLD_EXTREMA_WINDOW = 32
+
+
+def _window_reduce(values: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """Reduce every full trailing window with np.add, np.maximum or np.minimum.
+
+    Short windows fold the ufunc over the window offsets on contiguous slices,
+    which is much faster than reducing a strided sliding-window view. Longer
+    windows use O(n) forms: sums are differences of block-wise cumulative
+    sums, and extrema combine running extrema within window-length blocks.
+    """
+    if window < 1:
+        raise ValueError("Window must be a positive integer")
+
+    x = _as_float_array(values)
+    result = np.full(len(x), np.nan)
+    m = len(x) - window + 1
+    if m <= 0:
+        return result
+
+    if ufunc is np.add:
+        # Cumulative sums cannot difference out an infinite value
+        fold = window <= _FOLD_SUM_WINDOW or np.isinf(x).any()
+    else:
+        fold = window <= _FOLD_EXTREMA_WINDOW
+
+    if fold:
+        acc = x[:m].copy()
+        for k in range(1, window):
+            ufunc(acc, x[k : k + m], out=acc)
+        result[window - 1 :] = acc
+    elif ufunc is np.add:
+        result[window - 1 :] = _long_window_sums(x, window)[window - 1 :]
+    else:
+        _block_extrema(x, window, ufunc, out=result[window - 1 :])
+    return result
+
+
+def _long_window_sums(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums, NaN for any window containing NaN."""
+    block = max(window, 256)
+    valid = ~np.isnan(x)
+    if valid.all():
+        return _trailing_sums(x, window, block)
+
+    sums = _trailing_sums(np.where(valid, x, 0.0), window, block)
+    sums[_trailing_sums(~valid, window, block) > 0] = np.nan
+    return sums
+
+
+def _block_extrema(
+    x: np.ndarray, window: int, ufunc: np.ufunc, out: np.ndarray
+) -> None:
+    """Write the extremum of every full trailing window into out.
+
+    The series is cut into window-length blocks. A full window covers the
+    tail of one block and the head of the next, so its extremum combines a
+    running extremum from the block end backwards with one from the next
+    block start forwards. NaN propagates through both, as in the fold.
+    """
+    n = len(x)
+    num_blocks = -(-n // window)
+    padded = np.empty(num_blocks * window)
+    padded[:n] = x
+    # Padding only reaches tails of blocks no full window starts in
+    padded[n:] = x[-1]
+    blocks = padded.reshape(num_blocks, window)
+
+    forward = ufunc.accumulate(blocks, axis=1).ravel()
+    backward = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    ufunc(backward[: n - window + 1], forward[window - 1 : n], out=out)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Calculate rolling sum.
+
+    Args:
+        values: 1-D array of values
+        window: Rolling window size
+
+    Returns:
+        np.ndarray: Window sums, NaN until the first full window and for any
+        window containing NaN
+    """
+    return _window_reduce(values, window, np.add)
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Calculate rolling maximum.
+
+    Args:
+        values: 1-D array of values
+        window: Rolling window size
+
+    Returns:
+        np.ndarray: Window maxima, NaN until the first full window and for
+        any window containing NaN
+    """
+    return _window_reduce(values, window, np.maximum)
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Calculate rolling minimum.
+
+    Args:
+        values: 1-D array of values
+        window: Rolling window size
+
+    Returns:
+        np.ndarray: Window minima, NaN until the first full window and for
+        any window containing NaN
+    """
+    return _window_reduce(values, window, np.minimum)
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Calculate true range from high, low and close arrays.
+
+    The first bar has no previous close, so its true range is high - low.
+
+    Args:
+        high: 1-D array of high prices
+        low: 1-D array of low prices
+        close: 1-D array of close prices
+
+    Returns:
+        np.ndarray: Largest of high - low, |high - prev close| and
+        |low - prev close| for each bar
+    """
+    high = _as_float_array(high)
+    low = _as_float_array(low)
+    close = _as_float_array(close)
+
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
+
+    # fmax skips the missing previous close on the first bar
+    return np.fmax.reduce(
+        [high - low, np.abs(high - prev_close), np.abs(low - prev_close)]
+    )
+
+
+def ewm_mean(values: np.ndarray, span: float) -> np.ndarray:
+    """Calculate an exponentially weighted mean with adjust=False.
+
+    Matches pandas' ewm(span=span, adjust=False).mean(). The recurrence runs
+    as a loop over Python floats, which beats pandas on short arrays where its
+    fixed per-call overhead dominates; long series are better served by pandas
+    directly. Series with missing values after the first observation are
+    handed to pandas, since its weight decay across gaps is not reproduced by
+    the recurrence for every span (span=3 differs).
+
+    Args:
+        values: 1-D array of values
+        span: Decay specified as a span, alpha = 2 / (span + 1)
+
+    Returns:
+        np.ndarray: Weighted means, NaN before the first observation
+    """
+    if span < 1:
+        raise ValueError("Span must be at least 1")
+
+    x = np.asarray(values, dtype=np.float64)
+    observed = ~np.isnan(x)
+    if observed.any() and not observed[observed.argmax() :].all():
+        return pd.Series(x).ewm(span=span, adjust=False).mean().to_numpy()
+
+    alpha = 2.0 / (span + 1)
+    old_wt_factor = 1.0 - alpha
+    old_wt = 1.0
+    weighted = np.nan
+    result = []
+
+    for cur in x.tolist():
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        result.append(weighted)
+
+    return np.array(result, dtype=np.float64)
+
+
+def rolling_nanmean(values: np.ndarray, window: int) -> np.ndarray:
+    """Calculate rolling mean over the available values in each window.
+
+    Equivalent to pandas' rolling(window, min_periods=1).mean(): NaN values
+    are skipped and leading partial windows are averaged over what exists.
+
+    Args:
+        values: 1-D array of values
+        window: Rolling window size
+
+    Returns:
+        np.ndarray: Window means, NaN only where a window has no values
+    """
+    if window < 1:
+        raise ValueError("Window must be a positive integer")
+
+    x = _as_float_array(values)
+    n = len(x)
+    valid = ~np.isnan(x)
+
+    if window <= _SHORT_WINDOW:
+        filled = np.where(valid, x, 0.0)
+        total = filled.astype(np.float64)
+        count = valid.astype(np.float64)
+        for k in range(1, min(window, n)):
+            total[k:] += filled[:-k]
+            count[k:] += valid[:-k]
+    else:
+        block = max(window, 256)
+        if valid.all():
+            # Without NaN only the leading windows hold fewer values
+            mean = _trailing_sums(x, window, block)
+            head = min(window - 1, n)
+            mean[:head] /= np.arange(1, head + 1)
+            mean[head:] /= window
+            return mean
+
+        count = _trailing_sums(valid, window, block)
+        total = _trailing_sums(np.where(valid, x, 0.0), window, block)
+
+    mean = np.full(n, np.nan)
+    np.divide(total, count, out=mean, where=count > 0)
+    return mean
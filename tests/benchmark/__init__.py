@@ -0,0 +1 @@
+"""Tests for strategy benchmarking."""
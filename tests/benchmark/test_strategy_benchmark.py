@@ -0,0 +1,70 @@
+"""Tests for the strategy benchmark."""
+
+import unittest
+import pandas as pd
+import numpy as np
+from crypto_analytics.benchmark.strategy_benchmark import StrategyBenchmark
+from crypto_analytics.strategies import BaseStrategy
+
+
+class MockStrategy(BaseStrategy):
+    """Mock strategy holding a long position above a moving average."""
+
+    def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
+        """Return signals unchanged."""
+        return signals
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.Series:
+        """Generate long/flat positions from a 5-bar moving average.
+
+        Args:
+            data: OHLCV data
+
+        Returns:
+            pd.Series: 1 above the moving average, 0 otherwise
+        """
+        close = data["close"]
+        return (close > close.rolling(5).mean()).astype(int)
+
+
+class TestStrategyBenchmark(unittest.TestCase):
+    """Test cases for StrategyBenchmark."""
+
+    def setUp(self):
+        """Set up test data."""
+        rng = np.random.default_rng(3)
+        dates = pd.date_range(start="2023-01-01", periods=24 * 60, freq="h")
+        self.datasets = {}
+        for asset_name in ("BTC", "ETH"):
+            close = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+            self.datasets[asset_name] = pd.DataFrame(
+                {
+                    "open": close,
+                    "high": close * 1.01,
+                    "low": close * 0.99,
+                    "close": close,
+                    "volume": rng.integers(1000, 10000, len(dates)),
+                },
+                index=dates,
+            )
+
+    def test_parallel_matches_serial(self):
+        """Test worker processes give the same results as a serial run."""
+        serial = StrategyBenchmark([MockStrategy], ["1d"]).run_benchmarks(
+            self.datasets, max_workers=1
+        )
+        parallel = StrategyBenchmark([MockStrategy], ["1d"]).run_benchmarks(
+            self.datasets, max_workers=2
+        )
+
+        self.assertEqual(list(serial), ["BTC", "ETH"])
+        self.assertEqual(list(parallel), list(serial))
+        for asset_name in serial:
+            self.assertIn("MockStrategy_1d", serial[asset_name])
+            pd.testing.assert_frame_equal(
+                pd.DataFrame(parallel[asset_name]), pd.DataFrame(serial[asset_name])
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
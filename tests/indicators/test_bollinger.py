@@ -0,0 +1,38 @@
+"""Tests for Bollinger Bands indicators."""
+
+import unittest
+import pandas as pd
+import numpy as np
+from crypto_analytics.indicators import BollingerBands, BollingerOnline
+
+
+class TestBollingerOnline(unittest.TestCase):
+    """Test cases for streaming Bollinger Bands."""
+
+    def setUp(self):
+        """Set up test data."""
+        prices = np.random.randn(200).cumsum() + 100
+        self.test_data = pd.DataFrame({"close": prices})
+
+    def test_matches_batch(self):
+        """Test streamed bands match the batch indicator."""
+        expected = BollingerBands({"window": 20, "num_std": 2}).calculate(
+            self.test_data
+        )
+        online = BollingerOnline(window=20, num_std=2)
+        bands = pd.DataFrame(
+            [online.push(price) for price in self.test_data["close"]],
+            columns=["middle_band", "upper_band", "lower_band"],
+        )
+
+        for column in bands.columns:
+            np.testing.assert_allclose(bands[column], expected[column], rtol=1e-10)
+
+    def test_invalid_window(self):
+        """Test error handling."""
+        with self.assertRaises(ValueError):
+            BollingerOnline(window=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -179,6 +179,17 @@ class TestBollingerStrategy(unittest.TestCase):
         results = self.strategy.generate_signals(nan_data)
         self.assertIsInstance(results["performance"]["total_return"], float)
 
+    def test_streaming_update(self):
+        """Test streaming updates reproduce the batch signals."""
+        signals = self.strategy.calculate_signals(self.test_data)
+        expected = self.strategy.generate_signal_rules(signals)
+
+        streaming = BollingerStrategy()
+        streamed = [streaming.update(price) for price in self.test_data["close"]]
+
+        np.testing.assert_array_equal(streamed, expected["signal"].to_numpy())
+        self.assertEqual(streaming.current_position, expected["position"].iloc[-1])
+
 
 if __name__ == "__main__":
     unittest.main()
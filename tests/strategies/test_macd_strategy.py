@@ -160,6 +160,34 @@ class TestMACDStrategy(unittest.TestCase):
             results["performance"]["num_trades"], 0, "Should generate trades"
         )
 
+    def test_batch_matches_single(self):
+        """Test batched signal generation matches per-symbol results."""
+        closes = pd.DataFrame(
+            {
+                "A": self.test_data["close"],
+                "B": self.test_data["close"][::-1].to_numpy(),
+            },
+            index=self.test_data.index,
+        )
+        batch = self.strategy.generate_signals_batch(closes)
+
+        self.assertEqual(list(batch), ["A", "B"])
+        for symbol in closes.columns:
+            single = self.strategy.generate_signals(
+                closes[[symbol]].rename(columns={symbol: "close"})
+            )
+            self.assertEqual(batch[symbol]["symbol"], symbol)
+            self.assertEqual(
+                batch[symbol]["current_position"], single["current_position"]
+            )
+            self.assertEqual(
+                batch[symbol]["performance"]["num_trades"],
+                single["performance"]["num_trades"],
+            )
+
+        with self.assertRaises(ValueError):
+            self.strategy.generate_signals_batch(pd.DataFrame())
+
     def test_error_handling(self):
         """Test error handling."""
         # Test with missing close price
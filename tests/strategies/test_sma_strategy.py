@@ -3,17 +3,25 @@
 import unittest
 import pandas as pd
 import numpy as np
-from crypto_analytics.strategies import SMAStrategy
+from crypto_analytics.strategies.sma_strategy import SMAStrategy
 from crypto_analytics.utils import DataManager
 
 
+class MockSMAStrategy(SMAStrategy):
+    """Concrete SMA strategy for testing."""
+
+    def generate_signal_rules(self, signals: pd.DataFrame) -> pd.DataFrame:
+        """Return signals unchanged."""
+        return signals
+
+
 class TestSMAStrategy(unittest.TestCase):
     """Test cases for SMA strategy."""
 
     def setUp(self):
         """Set up test data."""
         self.data_manager = DataManager()
-        self.strategy = SMAStrategy()
+        self.strategy = MockSMAStrategy()
 
         # Create sample data
         dates = pd.date_range(start="2023-01-01", end="2023-12-31", freq="D")
@@ -33,6 +41,15 @@ class TestSMAStrategy(unittest.TestCase):
         correlation = sma.corr(self.test_data["close"])
         self.assertGreater(correlation, 0.9)
 
+    def test_unweighted_init(self):
+        """Test warm-up values without weighted initialization."""
+        period = 20
+        strategy = MockSMAStrategy(weighted_init=False)
+        sma = strategy.calculate_sma(self.test_data, period)
+        expected = self.test_data["close"].rolling(period, min_periods=1).mean()
+
+        np.testing.assert_allclose(sma.to_numpy(), expected.to_numpy())
+
     def test_generate_signals(self):
         """Test signal generation."""
         signals = self.strategy.generate_signals(self.test_data)
@@ -0,0 +1,84 @@
+"""Tests for the strategy generator."""
+
+import random
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from crypto_analytics.strategies.strategy_generator import (
+    AdaptiveStrategy,
+    StrategyGenerator,
+    _evaluate_population,
+)
+
+
+class TestStrategyGenerator(unittest.TestCase):
+    """Test cases for StrategyGenerator."""
+
+    def setUp(self):
+        """Set up test data."""
+        dates = pd.date_range(start="2023-01-01", periods=300, freq="h")
+        rng = np.random.default_rng(0)
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+        close[60:62] = np.nan
+        self.data = pd.DataFrame({"close": close}, index=dates)
+        self.generator = StrategyGenerator(self.data, self.data)
+
+    def test_population_scores_match_signals(self):
+        """Test batch scoring matches scoring each strategy's signals."""
+        random.seed(0)
+        population = [self.generator.generate_random_params() for _ in range(20)]
+        evaluator = self.generator.train_evaluator
+        indicators = AdaptiveStrategy(population[0])._compute_indicators(self.data)
+
+        results = _evaluate_population(population, self.data, evaluator, indicators)
+
+        for params, (fitness, metrics) in zip(population, results):
+            signals = AdaptiveStrategy(params).calculate_signals(self.data)
+            expected = evaluator.calculate_metrics(signals)
+            # A single losing bar leaves sortino_ratio NaN in both
+            np.testing.assert_equal(metrics, expected)
+            np.testing.assert_equal(fitness, evaluator.calculate_fitness(expected))
+
+    def test_serial_optimization_is_reproducible(self):
+        """Test a seeded serial optimization gives the same result twice."""
+        results = []
+        for _ in range(2):
+            random.seed(0)
+            results.append(
+                self.generator.optimize_strategy(
+                    population_size=6, generations=2, max_workers=1
+                )
+            )
+
+        np.testing.assert_equal(results[0], results[1])
+
+    def test_parallel_optimization_matches_serial(self):
+        """Test worker processes give the same populations and fitness."""
+        evolve = StrategyGenerator._evolve
+        runs = []
+        for max_workers in (1, 2):
+            evaluated = []
+
+            def recording_evolve(generator, population, generations, rate, evaluate):
+                def record(population):
+                    scores = evaluate(population)
+                    evaluated.append((list(population), scores))
+                    return scores
+
+                return evolve(generator, population, generations, rate, record)
+
+            random.seed(0)
+            with patch.object(StrategyGenerator, "_evolve", recording_evolve):
+                result = self.generator.optimize_strategy(
+                    population_size=6, generations=2, max_workers=max_workers
+                )
+            runs.append((evaluated, result))
+
+        self.assertEqual(len(runs[0][0]), 2)
+        # Metrics can hold NaN, which assert_equal treats as equal
+        np.testing.assert_equal(runs[0], runs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for the data manager."""
+
+import importlib.util
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+from pathlib import Path
+from crypto_analytics.utils import DataManager
+
+
+class TestDataManager(unittest.TestCase):
+    """Test cases for DataManager."""
+
+    def setUp(self):
+        """Set up test data."""
+        dates = pd.date_range(start="2023-01-01", periods=96, freq="h")
+        close = np.random.randn(len(dates)).cumsum() + 100
+        self.data = pd.DataFrame(
+            {
+                "open": close,
+                "high": close + 1,
+                "low": close - 1,
+                "close": close,
+                "volume": np.random.randint(1000, 10000, len(dates)),
+            },
+            index=dates,
+        )
+        self.manager = DataManager()
+        self.manager.load_data(self.data)
+
+    def test_cached_results_are_isolated(self):
+        """Test repeated calls match and editing a result leaves the cache."""
+        first = self.manager.resample_data("4h")
+        first.iloc[0, 0] = -1.0
+        second = self.manager.resample_data("4h")
+
+        self.assertEqual(len(second), 24)
+        self.assertNotEqual(second.iloc[0, 0], -1.0)
+        pd.testing.assert_frame_equal(
+            self.manager.prepare_data(["close", "volume"]),
+            self.data[["close", "volume"]],
+        )
+
+    def test_load_invalidates_cache(self):
+        """Test loading new data rebuilds derived frames."""
+        self.manager.prepare_data()
+        self.manager.resample_data("1D")
+
+        self.manager.load_data(self.data * 2)
+
+        pd.testing.assert_frame_equal(
+            self.manager.prepare_data(), self.data[["close"]] * 2
+        )
+        self.assertEqual(
+            self.manager.resample_data("1D")["close"].iloc[-1],
+            self.data["close"].iloc[-1] * 2,
+        )
+
+    def test_load_csv(self):
+        """Test a CSV file loads with its date index and values."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "data.csv")
+            self.data.to_csv(path)
+            loaded = DataManager().load_data(path)
+
+        pd.testing.assert_frame_equal(loaded, self.data, check_freq=False)
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow"), "pyarrow is not installed"
+    )
+    def test_load_csv_pyarrow_engine(self):
+        """Test the pyarrow CSV engine loads the same frame as the C engine."""
+        engine = "crypto_analytics.utils.data_manager._CSV_ENGINE"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "data.csv")
+            self.data.to_csv(path)
+            with patch(engine, "pyarrow"):
+                arrow = DataManager().load_data(path)
+            with patch(engine, "c"):
+                native = DataManager().load_data(path)
+
+        self.assertEqual(arrow.index.dtype, native.index.dtype)
+        pd.testing.assert_frame_equal(arrow, native)
+        pd.testing.assert_frame_equal(arrow, self.data, check_freq=False)
+
+    def test_returns_and_volatility(self):
+        """Test returns and volatility match pandas, including close gaps."""
+        dates = pd.date_range(start="2023-01-01", periods=600, freq="h")
+        close = pd.Series(
+            np.random.randn(len(dates)).cumsum() + 100, index=dates, name="close"
+        )
+        close.iloc[[10, 300, 301]] = np.nan
+        self.manager.load_data(close.to_frame())
+
+        expected_returns = close.pct_change(fill_method=None).dropna()
+        pd.testing.assert_series_equal(self.manager.get_returns(), expected_returns)
+
+        for window in (20, 252):
+            expected = expected_returns.rolling(window).std() * np.sqrt(252)
+            pd.testing.assert_series_equal(
+                self.manager.get_volatility(window), expected.dropna()
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
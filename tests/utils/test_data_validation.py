@@ -62,6 +62,30 @@ class TestDataValidation(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn("Null values found", messages[0])
 
+    def test_data_validation_nullable_columns(self):
+        """Test data validation with nullable integer volume."""
+        data = self.sample_data.copy()
+        data["volume"] = data["volume"].astype("Int64")
+        self.assertTrue(self.validator.validate_data(data)[0])
+
+        data.loc[data.index[0], "volume"] = pd.NA
+        is_valid, messages = self.validator.validate_data(data)
+        self.assertFalse(is_valid)
+        self.assertIn("Null values found in columns: ['volume']", messages[0])
+
+    def test_data_validation_string_column(self):
+        """Test data validation with a non-numeric required column."""
+        validator = DataValidator(["symbol", "close", "high", "low", "volume"])
+        data = self.sample_data.assign(symbol="BTC")
+        is_valid, messages = validator.validate_data(data)
+        self.assertTrue(is_valid)
+        self.assertEqual(messages, ["Data validation successful"])
+
+        data.loc[data.index[0], "symbol"] = None
+        is_valid, messages = validator.validate_data(data)
+        self.assertFalse(is_valid)
+        self.assertIn("Null values found in columns: ['symbol']", messages[0])
+
     def test_data_validation_invalid_price_relationships(self):
         """Test data validation with invalid price relationships."""
         invalid_data = self.sample_data.copy()
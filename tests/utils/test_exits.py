@@ -0,0 +1,66 @@
+"""Tests for stop-loss and take-profit exit helpers."""
+
+import unittest
+import numpy as np
+from crypto_analytics.utils.exits import level_exits
+
+
+def _walk_exits(close, position, stop_loss, take_profit):
+    """Reference bar-by-bar walk of the exit rules."""
+    position = position.copy()
+    stop_exits = np.zeros(len(close), dtype=bool)
+    take_exits = np.zeros(len(close), dtype=bool)
+
+    for i in range(1, len(close)):
+        prev_position = position[i - 1]
+        if prev_position != 0:
+            move = (close[i] - close[i - 1]) / close[i - 1] * prev_position
+            if move <= -stop_loss:
+                stop_exits[i] = True
+                position[i] = 0
+            elif move >= take_profit:
+                take_exits[i] = True
+                position[i] = 0
+
+    return stop_exits, take_exits
+
+
+class TestLevelExits(unittest.TestCase):
+    """Test cases for level_exits."""
+
+    def test_matches_walk(self):
+        """Test results match a bar-by-bar walk, including consecutive hits."""
+        rng = np.random.default_rng(42)
+        for volatility in (0.002, 0.02, 0.08):
+            close = 100 * np.cumprod(1 + rng.normal(0, volatility, 500))
+            close[40] = np.nan
+            position = np.repeat(rng.choice([-1.0, 0.0, 1.0, 2.0], 100), 5)
+
+            stop_exits, take_exits = level_exits(close, position, 0.01, 0.02)
+            expected_stop, expected_take = _walk_exits(close, position, 0.01, 0.02)
+
+            np.testing.assert_array_equal(stop_exits, expected_stop)
+            np.testing.assert_array_equal(take_exits, expected_take)
+
+    def test_alternating_exits(self):
+        """Test a run of breaching bars exits on every other bar."""
+        close = 100 * 0.9 ** np.arange(6)
+        position = np.ones(6)
+
+        stop_exits, take_exits = level_exits(close, position, 0.05, 0.05)
+
+        np.testing.assert_array_equal(
+            stop_exits, [False, True, False, True, False, True]
+        )
+        self.assertFalse(take_exits.any())
+
+    def test_short_input(self):
+        """Test empty and single-bar input."""
+        for n in (0, 1):
+            stop_exits, take_exits = level_exits(np.ones(n), np.ones(n), 0.01, 0.02)
+            self.assertEqual(len(stop_exits), n)
+            self.assertFalse(stop_exits.any() or take_exits.any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -111,6 +111,38 @@ class TestMarketAnalysis(unittest.TestCase):
         self.assertEqual(len(support), len(self.sample_data))
         self.assertEqual(len(resistance), len(self.sample_data))
 
+    def test_support_resistance_levels(self):
+        """Test levels are the rolling extremes that hold on both sides."""
+        support, resistance = self.analyzer.identify_support_resistance(
+            self.sample_data, window=5, num_points=3
+        )
+        rolling_low = self.sample_data["low"].rolling(5).min()
+        rolling_high = self.sample_data["high"].rolling(5).max()
+
+        for i in range(len(self.sample_data)):
+            low_before = rolling_low.iloc[max(i - 3, 0) : i]
+            low_after = rolling_low.iloc[i + 1 : i + 4]
+            is_support = (
+                3 <= i < len(rolling_low) - 3
+                and (low_before >= rolling_low.iloc[i]).all()
+                and (low_after > rolling_low.iloc[i]).all()
+            )
+            self.assertEqual(support.notna().iloc[i], is_support)
+
+            high_before = rolling_high.iloc[max(i - 3, 0) : i]
+            high_after = rolling_high.iloc[i + 1 : i + 4]
+            is_resistance = (
+                3 <= i < len(rolling_high) - 3
+                and (high_before <= rolling_high.iloc[i]).all()
+                and (high_after < rolling_high.iloc[i]).all()
+            )
+            self.assertEqual(resistance.notna().iloc[i], is_resistance)
+
+        self.assertTrue(support.notna().any() and resistance.notna().any())
+        pd.testing.assert_series_equal(
+            support.dropna(), rolling_low[support.notna()], check_names=False
+        )
+
     def test_market_strength(self):
         """Test market strength calculation."""
         strength = self.analyzer.calculate_market_strength(self.sample_data)
@@ -0,0 +1,232 @@
+"""Tests for rolling window helpers."""
+
+import unittest
+import pandas as pd
+import numpy as np
+from crypto_analytics.utils.rolling import (
+    compare_prev,
+    diff,
+    ewm_mean,
+    pct_change,
+    rolling_max,
+    rolling_mean_std,
+    rolling_min,
+    rolling_nanmean,
+    rolling_sum,
+    true_range,
+)
+
+
+class TestRollingMeanStd(unittest.TestCase):
+    """Test cases for rolling_mean_std."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.values = np.random.randn(200).cumsum() + 100
+
+    def test_matches_pandas(self):
+        """Test results match pandas rolling mean and std."""
+        mean, std = rolling_mean_std(self.values, 20)
+        series = pd.Series(self.values)
+
+        np.testing.assert_allclose(
+            mean, series.rolling(20).mean().to_numpy(), rtol=1e-10
+        )
+        np.testing.assert_allclose(
+            std, series.rolling(20).std().to_numpy(), rtol=1e-10
+        )
+
+    def test_mixed_magnitudes(self):
+        """Test no drift after large values leave the window."""
+        small = 1 + 0.01 * np.random.randn(500)
+        values = np.concatenate([np.full(50, 1e4), small])
+        _, std = rolling_mean_std(values, 20)
+
+        expected = np.std(small[-20:], ddof=1)
+        self.assertAlmostEqual(std[-1] / expected, 1.0, places=12)
+
+    def test_long_window(self):
+        """Test long windows and magnitude jumps inside a window's blocks."""
+        rng = np.random.default_rng(7)
+        small = 1 + 0.01 * rng.standard_normal(2000)
+        values = np.concatenate([np.full(30, 1e6), small])
+
+        for window in (20, 252):
+            mean, std = rolling_mean_std(values, window)
+            windows = np.lib.stride_tricks.sliding_window_view(values, window)
+            np.testing.assert_allclose(mean[window - 1 :], windows.mean(axis=1))
+            np.testing.assert_allclose(
+                std[window - 1 :], windows.std(axis=1, ddof=1), rtol=1e-9
+            )
+
+    def test_nan_handling(self):
+        """Test warm-up and NaN windows."""
+        values = self.values.copy()
+        values[50] = np.nan
+        mean, std = rolling_mean_std(values, 10)
+
+        self.assertTrue(np.isnan(mean[:9]).all())
+        self.assertTrue(np.isnan(std[50:60]).all())
+        self.assertFalse(np.isnan(std[60]))
+
+        short_mean, short_std = rolling_mean_std(values[:5], 10)
+        self.assertTrue(np.isnan(short_mean).all())
+        self.assertTrue(np.isnan(short_std).all())
+
+    def test_invalid_window(self):
+        """Test error handling."""
+        with self.assertRaises(ValueError):
+            rolling_mean_std(self.values, 0)
+
+
+class TestRollingReductions(unittest.TestCase):
+    """Test cases for rolling sum, max and min."""
+
+    def test_matches_pandas(self):
+        """Test results match pandas rolling reductions, including NaN."""
+        values = np.random.randn(100)
+        values[30] = np.nan
+        series = pd.Series(values)
+
+        np.testing.assert_allclose(
+            rolling_sum(values, 5), series.rolling(5).sum().to_numpy()
+        )
+        np.testing.assert_array_equal(
+            rolling_max(values, 5), series.rolling(5).max().to_numpy()
+        )
+        np.testing.assert_array_equal(
+            rolling_min(values, 5), series.rolling(5).min().to_numpy()
+        )
+
+    def test_long_windows(self):
+        """Test windows past the fold cutoffs match pandas, including NaN."""
+        rng = np.random.default_rng(5)
+        values = rng.standard_normal(2000).cumsum() + 100
+        values[[100, 900, 901]] = np.nan
+        series = pd.Series(values)
+
+        for window in (17, 50, 300):
+            np.testing.assert_allclose(
+                rolling_sum(values, window),
+                series.rolling(window).sum().to_numpy(),
+                rtol=1e-12,
+            )
+            np.testing.assert_array_equal(
+                rolling_max(values, window), series.rolling(window).max().to_numpy()
+            )
+            np.testing.assert_array_equal(
+                rolling_min(values, window), series.rolling(window).min().to_numpy()
+            )
+
+    def test_nanmean_matches_pandas(self):
+        """Test rolling_nanmean matches min_periods=1 rolling mean."""
+        values = np.random.randn(100)
+        values[[0, 30, 31, 32, 33, 34]] = np.nan
+        expected = pd.Series(values).rolling(3, min_periods=1).mean()
+
+        np.testing.assert_allclose(rolling_nanmean(values, 3), expected.to_numpy())
+
+    def test_nanmean_long_window(self):
+        """Test long windows spanning several blocks, with and without NaN."""
+        rng = np.random.default_rng(11)
+        values = rng.standard_normal(1500).cumsum() + 100
+
+        for window in (20, 200, 300):
+            for gaps in (False, True):
+                data = values.copy()
+                if gaps:
+                    data[rng.integers(len(data), size=200)] = np.nan
+                    data[400:750] = np.nan
+                expected = pd.Series(data).rolling(window, min_periods=1).mean()
+                np.testing.assert_allclose(
+                    rolling_nanmean(data, window), expected.to_numpy(), rtol=1e-12
+                )
+
+    def test_strided_input(self):
+        """Test a column of a row-major matrix gives the same results."""
+        matrix = np.random.randn(100, 5)
+        column = matrix[:, 3]
+        contiguous = column.copy()
+
+        np.testing.assert_array_equal(
+            rolling_sum(column, 5), rolling_sum(contiguous, 5)
+        )
+        np.testing.assert_array_equal(
+            rolling_mean_std(column, 5)[1], rolling_mean_std(contiguous, 5)[1]
+        )
+
+    def test_short_input(self):
+        """Test inputs shorter than the window and invalid windows."""
+        self.assertTrue(np.isnan(rolling_max(np.arange(3.0), 5)).all())
+        with self.assertRaises(ValueError):
+            rolling_sum(np.arange(3.0), 0)
+
+
+class TestTrueRange(unittest.TestCase):
+    """Test cases for true_range."""
+
+    def test_matches_pandas(self):
+        """Test result matches the DataFrame max of the three ranges."""
+        close = pd.Series(np.random.randn(100).cumsum() + 100)
+        high = close + np.random.rand(100)
+        low = close - np.random.rand(100)
+        prev_close = close.shift(1)
+        expected = pd.concat(
+            [high - low, abs(high - prev_close), abs(low - prev_close)], axis=1
+        ).max(axis=1)
+
+        result = true_range(high.to_numpy(), low.to_numpy(), close.to_numpy())
+
+        np.testing.assert_allclose(result, expected.to_numpy())
+        self.assertEqual(result[0], high[0] - low[0])
+
+
+class TestEwmMean(unittest.TestCase):
+    """Test cases for ewm_mean."""
+
+    def test_matches_pandas(self):
+        """Test result matches pandas ewm with adjust=False, including NaN."""
+        values = np.random.randn(200).cumsum() + 100
+        values[[0, 50, 51, 120]] = np.nan
+
+        for span in (2, 3, 9, 26):
+            expected = pd.Series(values).ewm(span=span, adjust=False).mean()
+            np.testing.assert_allclose(
+                ewm_mean(values, span), expected.to_numpy(), rtol=1e-12
+            )
+
+    def test_invalid_span(self):
+        """Test error handling."""
+        with self.assertRaises(ValueError):
+            ewm_mean(np.arange(3.0), 0)
+
+
+class TestBarChanges(unittest.TestCase):
+    """Test cases for pct_change, diff and compare_prev."""
+
+    def test_matches_pandas(self):
+        """Test results match the pandas Series methods, including NaN."""
+        values = np.random.randn(100).cumsum() + 100
+        values[30] = np.nan
+        series = pd.Series(values)
+
+        for periods in (1, 2, 3):
+            np.testing.assert_allclose(
+                pct_change(values, periods),
+                (series / series.shift(periods) - 1).to_numpy(),
+            )
+        np.testing.assert_allclose(diff(values), series.diff().to_numpy())
+        np.testing.assert_array_equal(
+            compare_prev(values, np.greater),
+            (series > series.shift(1)).to_numpy(),
+        )
+
+    def test_short_input(self):
+        """Test inputs no longer than the lookback."""
+        self.assertTrue(np.isnan(pct_change(np.arange(1.0, 3.0), 2)).all())
+        self.assertTrue(np.isnan(diff(np.ones(1))).all())
+        self.assertEqual(len(compare_prev(np.ones(0), np.less)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()